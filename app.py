@@ -0,0 +1,19 @@
+import streamlit as st
+
+# Single entry point for every DataVerse app: `streamlit run app.py`.
+# Pages run in one process, so st.cache_resource/st.cache_data entries in
+# shared.py are built once and reused across pages, and a page's heavy
+# imports are only loaded the first time that page is opened.
+PAGES = [
+    ("stock.py", "Stock Trend Analysis", "📈"),
+    ("clustering.py", "K-Means Clustering", "🔍"),
+    ("tree.py", "Decision Tree Explorer", "🌳"),
+    ("association.py", "Association Rules", "🛒"),
+    ("sen.py", "Sentiment Analysis", "💬"),
+    ("music.py", "Music Genre Classifier", "🎵"),
+    ("movie.py", "Movie Recommendations", "🎬"),
+    ("data.py", "Data Cleaning", "🧹"),
+    ("bin.py", "Binning", "🗑️"),
+]
+
+st.navigation([st.Page(path, title=title, icon=icon) for path, title, icon in PAGES]).run()
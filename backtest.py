@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from indicators import wilder_rsi
+
+TRADING_DAYS = 252
+# Forking the multi-threaded Streamlit server can deadlock the child, so workers start from a clean process
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+# Trailing means for many windows at once from one cumulative sum; NaN until the window fills
+def moving_average_matrix(close, windows):
+    close = np.asarray(close, dtype=float)
+    csum = np.concatenate([[0.0], np.cumsum(close)])
+    out = np.full((len(windows), len(close)), np.nan)
+    for i, w in enumerate(windows):
+        if w <= len(close):
+            out[i, w - 1:] = (csum[w:] - csum[:-w]) / w
+    return out
+
+
+# Forward-fill NaNs along the last axis of a 2-D array
+def _ffill(values):
+    valid = ~np.isnan(values)
+    idx = np.where(valid, np.arange(values.shape[-1]), 0)
+    np.maximum.accumulate(idx, axis=-1, out=idx)
+    return np.take_along_axis(values, idx, axis=-1)
+
+
+# Returns, drawdown and trade counts for a stack of 0/1 positions (rows) held on the next bar
+def _metrics(positions, log_returns):
+    held = np.zeros_like(positions)
+    held[:, 1:] = positions[:, :-1]
+    strategy = held * log_returns
+    equity = np.cumsum(strategy, axis=1)
+    peak = np.maximum.accumulate(np.maximum(equity, 0.0), axis=1)
+    drawdown = 1 - np.exp(equity - peak)
+    entries = np.diff(positions, axis=1, prepend=0) > 0
+    volatility = strategy.std(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(volatility > 0, strategy.mean(axis=1) / volatility * np.sqrt(TRADING_DAYS), np.nan)
+    return {
+        "total_return": np.expm1(equity[:, -1]),
+        "max_drawdown": drawdown.max(axis=1),
+        "trades": entries.sum(axis=1),
+        "exposure": positions.mean(axis=1),
+        "sharpe": sharpe,
+    }
+
+
+def _log_returns(close):
+    return np.diff(np.log(close), prepend=np.log(close[0]))
+
+
+# One worker's share of the crossover grid: a few short windows against every long window
+def _crossover_chunk(close, short_windows, long_windows):
+    log_returns = _log_returns(close)
+    long_ma = moving_average_matrix(close, long_windows)
+    short_ma = moving_average_matrix(close, short_windows)
+    rows = []
+    for i, s in enumerate(short_windows):
+        positions = (short_ma[i] > long_ma).astype(float)
+        metrics = _metrics(positions, log_returns)
+        for j, l in enumerate(long_windows):
+            if s < l:
+                rows.append({"short_window": s, "long_window": l, **{k: v[j] for k, v in metrics.items()}})
+    return rows
+
+
+# One worker's share of the RSI grid: long below `lower`, flat above `upper`, hold in between
+def _rsi_chunk(close, periods, lower_thresholds, upper_thresholds):
+    log_returns = _log_returns(close)
+    pairs = [(lo, up) for lo in lower_thresholds for up in upper_thresholds if lo < up]
+    if not pairs:
+        return []
+    lowers = np.array([p[0] for p in pairs])[:, None]
+    uppers = np.array([p[1] for p in pairs])[:, None]
+    rows = []
+    for period in periods:
+        rsi = wilder_rsi(pd.Series(close), period).to_numpy()[None, :]
+        state = np.where(rsi < lowers, 1.0, np.where(rsi > uppers, 0.0, np.nan))
+        positions = np.nan_to_num(_ffill(state), nan=0.0)
+        metrics = _metrics(positions, log_returns)
+        for j, (lo, up) in enumerate(pairs):
+            rows.append({"rsi_period": period, "lower": lo, "upper": up, **{k: v[j] for k, v in metrics.items()}})
+    return rows
+
+
+# Split the outer parameter across a process pool and collect every worker's rows
+def _run_grid(worker, close, outer, *inner, max_workers=None):
+    close = np.asarray(close, dtype=float)
+    if not outer or len(close) < 2:
+        return pd.DataFrame()
+    max_workers = max_workers or os.cpu_count() or 1
+    chunks = [c.tolist() for c in np.array_split(np.asarray(outer), min(max_workers, len(outer)))]
+    if max_workers == 1 or len(chunks) == 1:
+        rows = [row for chunk in chunks for row in worker(close, chunk, *inner)]
+    else:
+        context = multiprocessing.get_context(_START_METHOD)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+            futures = [pool.submit(worker, close, chunk, *inner) for chunk in chunks]
+            rows = [row for future in futures for row in future.result()]
+    return pd.DataFrame(rows)
+
+
+def sweep_crossover(close, short_windows, long_windows, max_workers=None):
+    """Backtest every short/long MA crossover pair (short < long) on a close series.
+
+    Long while the short MA is above the long MA, flat otherwise. Returns one
+    row per pair with total return, max drawdown, trade count, exposure and
+    annualized Sharpe ratio.
+    """
+    return _run_grid(_crossover_chunk, close, list(short_windows), list(long_windows), max_workers=max_workers)
+
+
+def sweep_rsi(close, periods, lower_thresholds, upper_thresholds, max_workers=None):
+    """Backtest RSI threshold strategies over periods x lower x upper thresholds.
+
+    Enters when RSI drops below `lower`, exits when it rises above `upper`.
+    """
+    return _run_grid(_rsi_chunk, close, list(periods), list(lower_thresholds), list(upper_thresholds),
+                     max_workers=max_workers)
+
+
+def buy_and_hold(close):
+    close = np.asarray(close, dtype=float)
+    metrics = _metrics(np.ones((1, len(close))), _log_returns(close))
+    return {k: v[0] for k, v in metrics.items()}
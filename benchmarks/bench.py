@@ -0,0 +1,341 @@
+"""Headless benchmarks for each app's core computation on synthetic data.
+
+Every case runs at a few scaled sizes and records wall time and peak traced
+memory. Results can be saved as a baseline and later runs compared against
+it, flagging any case that got slower or heavier than the allowed ratio.
+Correctness checks run first; any failure exits with status 1.
+
+    python benchmarks/bench.py                        # run and print
+    python benchmarks/bench.py --save-baseline        # store benchmarks/baseline.json
+    python benchmarks/bench.py --compare --ratio 1.3  # exit 1 on regressions
+    python benchmarks/bench.py --only stock tree --scale 2
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib import metadata
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+WORDS = ["great", "terrible", "okay", "love", "hate", "product", "service", "value", "fast", "slow",
+         "recommend", "never", "again", "best", "worst", "price", "quality", "support", "happy", "sad"]
+
+
+# Synthetic data generators
+
+def make_numbers(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(1, 100, n).tolist()
+
+
+def make_transactions(n, n_items=40, basket=4, seed=0):
+    rng = np.random.default_rng(seed)
+    items = [f"item_{i}" for i in range(n_items)]
+    weights = 1 / np.arange(1, n_items + 1)
+    weights /= weights.sum()
+    return [list(rng.choice(items, size=basket, replace=False, p=weights)) for _ in range(n)]
+
+
+def make_blobs(n, seed=0):
+    from sklearn.datasets import make_blobs as sk_make_blobs
+
+    X, _ = sk_make_blobs(n_samples=n, centers=4, cluster_std=0.6, random_state=seed)
+    return X
+
+
+def make_messy_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Product": rng.choice(list("ABCDEFG"), n).astype(object),
+        "Revenue": rng.normal(2000, 500, n).round(),
+        "Units Sold": rng.integers(1, 50, n).astype(object),
+    })
+    for col in df.columns:
+        df.loc[rng.random(n) < 0.05, col] = None
+    return pd.concat([df, df.sample(frac=0.1, random_state=seed)], ignore_index=True)
+
+
+def make_movies(n, seed=0):
+    rng = random.Random(seed)
+    genres = ["Action", "Comedy", "Drama", "Horror", "Romance", "Sci-Fi", "Thriller", "Animation"]
+    return pd.DataFrame({
+        "title": ["".join(rng.choices(string.ascii_letters, k=12)) for _ in range(n)],
+        "genres": ["|".join(rng.sample(genres, rng.randint(1, 3))) for _ in range(n)],
+    })
+
+
+def make_audio(seconds, sr=22050, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sr)) / sr
+    return (np.sin(2 * np.pi * 440 * t) + 0.1 * rng.standard_normal(len(t))).astype(np.float32), sr
+
+
+def make_texts(n, unique_ratio=0.3, seed=0):
+    rng = random.Random(seed)
+    pool = [" ".join(rng.choices(WORDS, k=rng.randint(3, 10))) + rng.choice(["!", ".", "?"])
+            for _ in range(max(1, int(n * unique_ratio)))]
+    return pd.Series([rng.choice(pool) for _ in range(n)])
+
+
+def make_prices(n, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2000-01-03", periods=n)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))), index=index, name="Close")
+
+
+def make_classification(n, seed=0):
+    from sklearn.datasets import make_classification as sk_make_classification
+
+    X, y = sk_make_classification(n_samples=n, n_features=20, n_informative=10, random_state=seed)
+    return pd.DataFrame(X, columns=[f"f{i}" for i in range(X.shape[1])]), y
+
+
+# Benchmark cases: each builds its data up front and returns the callable to time
+
+def case_bin(n):
+    from bin import equal_width_binning, equal_depth_binning
+
+    data = make_numbers(n)
+    return lambda: (equal_width_binning(data, 10), equal_depth_binning(data, 10))
+
+
+def case_association(n):
+    from association import encode_transactions, mine_rules
+
+    transactions = make_transactions(n)
+    return lambda: mine_rules(encode_transactions(transactions), 0.05, 0.3, 1.0, 0.0)
+
+
+def case_clustering(n):
+    from clustering import elbow_sweep
+
+    X = make_blobs(n)
+    return lambda: elbow_sweep(X, range(1, 11), random_state=0)
+
+
+def case_data(n):
+    from data import clean_data
+
+    df = make_messy_frame(n)
+    return lambda: clean_data(df, 'Fill with value', '0', remove_duplicates=True)
+
+
+def case_movie(n):
+    from movie import get_movies_by_genre, genre_list
+
+    movies = make_movies(n)
+    return lambda: [get_movies_by_genre(movies, g) for g in genre_list(movies)]
+
+
+def case_music(seconds):
+    from music import extract_features
+
+    audio, sr = make_audio(seconds)
+    return lambda: extract_features(audio, sr)
+
+
+def case_sentiment(n):
+    from sen import score_texts
+    from sentiment_cache import SentimentCache
+
+    texts = make_texts(n)
+
+    def run():
+        # A fresh cache per run measures cold scoring with in-dataset dedup only
+        with tempfile.TemporaryDirectory() as tmp:
+            score_texts(texts, SentimentCache(os.path.join(tmp, "cache.sqlite")))
+    return run
+
+
+def case_stock(n):
+    from indicators import compute_indicators
+
+    close = make_prices(n)
+    return lambda: compute_indicators(close)
+
+
+def case_tree(n):
+    from tree import make_model
+
+    X, y = make_classification(n)
+
+    def run():
+        model = make_model('classification', max_depth=10, min_samples_split=2, min_samples_leaf=1, criterion='gini')
+        model.fit(X, y)
+        model.predict(X)
+    return run
+
+
+# name -> (case factory, base sizes, size unit)
+CASES = {
+    "bin": (case_bin, [1_000, 10_000, 50_000], "values"),
+    "association": (case_association, [500, 2_000, 10_000], "transactions"),
+    "clustering": (case_clustering, [300, 3_000, 30_000], "points"),
+    "data": (case_data, [1_000, 50_000, 500_000], "rows"),
+    "movie": (case_movie, [1_000, 10_000, 100_000], "movies"),
+    "music": (case_music, [5, 30, 120], "seconds"),
+    "sentiment": (case_sentiment, [100, 1_000, 5_000], "texts"),
+    "stock": (case_stock, [1_000, 5_000, 20_000], "bars"),
+    "tree": (case_tree, [1_000, 10_000, 100_000], "rows"),
+}
+
+
+# Correctness checks: each returns a list of failure messages
+
+# Intraday refreshes through IndicatorEngine must match a full recompute,
+# including when the latest bar is revised before the next one arrives
+def check_indicator_engine(n=1_000, tolerance=1e-9):
+    from indicators import IndicatorEngine, compute_indicators
+
+    close = make_prices(n)
+    engine = IndicatorEngine()
+    failures = []
+    for end in range(n // 2, n + 1):
+        engine.update("SYM", pd.concat([close.iloc[:end - 1], close.iloc[end - 1:end] * 1.01]))
+        latest = engine.update("SYM", close.iloc[:end])
+        full = compute_indicators(close.iloc[:end])
+        for key in ["short_ma", "long_ma", "rsi", "signal"]:
+            a, b = latest[key], float(full[key].iloc[-1])
+            if not (a == b or (math.isnan(a) and math.isnan(b)) or math.isclose(a, b, rel_tol=tolerance)):
+                failures.append(f"{key} at bar {end}: incremental {a!r} != full {b!r}")
+    return failures
+
+
+CHECKS = {
+    "indicator engine parity": check_indicator_engine,
+}
+
+
+def run_checks():
+    failed = False
+    for name, check in CHECKS.items():
+        try:
+            failures = check()
+        except ImportError as e:
+            print(f"{name:<40} skipped ({e})")
+            continue
+        print(f"{name:<40} {'FAILED' if failures else 'ok'}")
+        for line in failures[:10]:
+            print(f"  {line}")
+        failed = failed or bool(failures)
+    return failed
+
+
+# Best wall time over untraced runs, then one traced run for peak allocation
+def measure(run, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def run_suite(names, scale, repeats):
+    results = {}
+    for name in names:
+        factory, sizes, unit = CASES[name]
+        for size in sizes:
+            size = max(1, int(size * scale))
+            key = f"{name}[{size} {unit}]"
+            try:
+                seconds, peak = measure(factory(size), repeats)
+            except ImportError as e:
+                print(f"{key:<40} skipped ({e})")
+                continue
+            results[key] = {"seconds": seconds, "peak_bytes": peak}
+            print(f"{key:<40} {seconds * 1000:10.1f} ms  {peak / 2**20:8.1f} MB")
+    return results
+
+
+# Where a baseline was measured; timings only compare meaningfully on similar setups
+def environment():
+    versions = {}
+    for name in ["numpy", "pandas", "scikit-learn", "mlxtend", "librosa", "textblob"]:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+# Slowdowns smaller than `min_delta` seconds are timer and scheduler noise, not regressions
+def compare(results, baseline, ratio, min_delta=0.005):
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for metric in ["seconds", "peak_bytes"]:
+            if metric == "seconds" and current[metric] - base[metric] < min_delta:
+                continue
+            if base[metric] and current[metric] / base[metric] > ratio:
+                regressions.append(f"{key} {metric}: {base[metric]:.4g} -> {current[metric]:.4g} "
+                                   f"({current[metric] / base[metric]:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="run only these cases")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every case size")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per case; best time is kept")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to the baseline file")
+    parser.add_argument("--compare", action="store_true", help="flag regressions against the baseline")
+    parser.add_argument("--ratio", type=float, default=1.25, help="allowed slowdown/growth before flagging")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="ignore slowdowns below this many seconds")
+    args = parser.parse_args()
+
+    if run_checks():
+        sys.exit(1)
+    results = run_suite(args.only or list(CASES), args.scale, args.repeats)
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            sys.exit(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\nBaseline measured on Python {baseline['environment']['python']}, "
+              f"{baseline['environment']['platform']}")
+        regressions = compare(results, baseline["results"], args.ratio, args.min_delta)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Cold-start time and resident memory: nine separate apps vs. the multipage launcher.
+
+Each app's cost is approximated by importing the modules its script imports
+at top level, in a fresh interpreter, which is what a cold Streamlit start
+pays before the first widget renders. Pass a git revision to measure the
+"before" numbers from the scripts as they were at that revision:
+
+    python benchmarks/startup.py [--before-rev <rev>]
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import importlib, json, resource, sys, time
+sys.path.insert(0, {root!r})
+timings, missing = [], []
+for group in {groups!r}:
+    start = time.perf_counter()
+    for name in group:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            missing.append(name)
+    timings.append(time.perf_counter() - start)
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"timings": timings, "missing": missing,
+                  "max_rss_kb": rss if sys.platform != "darwin" else rss // 1024}}))
+"""
+
+
+def read_source(path, rev=None):
+    if rev:
+        return subprocess.run(["git", "show", f"{rev}:{path}"], capture_output=True, text=True,
+                              check=True, cwd=ROOT).stdout
+    with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+        return f.read()
+
+
+# The launcher's page list, read without executing app.py
+def launcher_pages():
+    for node in ast.parse(read_source("app.py")).body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "PAGES":
+            return ast.literal_eval(node.value)
+    raise RuntimeError("PAGES not found in app.py")
+
+
+# Modules imported by a script's top-level statements (not inside functions)
+def top_level_imports(path, rev=None):
+    tree = ast.parse(read_source(path, rev))
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+def run_probe(groups):
+    out = subprocess.run([sys.executable, "-c", PROBE.format(root=ROOT, groups=groups)],
+                         capture_output=True, text=True, check=True, cwd=ROOT)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    if result["missing"]:
+        print(f"  warning: could not import {', '.join(sorted(set(result['missing'])))}; numbers understate the cost")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--before-rev", help="git revision whose scripts give the 'before' numbers")
+    args = parser.parse_args()
+    pages = launcher_pages()
+
+    print(f"Before: every app started as its own process ({args.before_rev or 'working tree'})")
+    separate_time = separate_rss = 0
+    for path, title, _ in pages:
+        result = run_probe([top_level_imports(path, args.before_rev)])
+        separate_time += result["timings"][0]
+        separate_rss += result["max_rss_kb"]
+        print(f"  {title:<40} {result['timings'][0]:7.2f} s  {result['max_rss_kb'] / 1024:8.1f} MB")
+    print(f"  {'Total':<40} {separate_time:7.2f} s  {separate_rss / 1024:8.1f} MB")
+
+    print("\nAfter: one launcher process, pages load their imports on first visit")
+    # st.navigation runs the first page on start-up, so its imports are part of the cold start
+    (default_path, default_title, _), other_pages = pages[0], pages[1:]
+    groups = [top_level_imports("app.py") + top_level_imports(default_path)]
+    groups += [top_level_imports(path) for path, _, _ in other_pages]
+    result = run_probe(groups)
+    print(f"  {'Launcher cold start':<40} {result['timings'][0]:7.2f} s  (app.py + {default_title})")
+    for (path, title, _), seconds in zip(other_pages, result["timings"][1:]):
+        print(f"  {'+ first visit: ' + title:<40} {seconds:7.2f} s")
+    print(f"  {'Total (all pages visited)':<40} {sum(result['timings']):7.2f} s  {result['max_rss_kb'] / 1024:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
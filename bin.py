@@ -4,6 +4,7 @@ import pandas as pd
 import random
 import matplotlib.pyplot as plt
 from io import BytesIO
+from profiling import page, span
 
 # Function to perform equal width binning
 def equal_width_binning(data, num_bins):
@@ -49,64 +50,72 @@ def get_csv_download_link(df):
     return output
 
 # Streamlit App
-st.title("🗑️ Binning Application")
-st.sidebar.header("User Input Controls")
+def main():
+    st.title("🗑️ Binning Application")
+    st.sidebar.header("User Input Controls")
 
-# User input for binning type
-binning_type = st.sidebar.selectbox("Select Binning Type", ["Equal Width", "Equal Depth"])
+    # User input for binning type
+    binning_type = st.sidebar.selectbox("Select Binning Type", ["Equal Width", "Equal Depth"])
 
-# User input for data source
-data_source = st.sidebar.selectbox("Select Data Source", ["Enter Data", "Generate Random", "Upload CSV"])
+    # User input for data source
+    data_source = st.sidebar.selectbox("Select Data Source", ["Enter Data", "Generate Random", "Upload CSV"])
 
-# Display rules if CSV upload is selected
-if data_source == "Upload CSV":
-    st.subheader("📜 Rules for Uploading CSV")
-    st.markdown("""
+    # Display rules if CSV upload is selected
+    if data_source == "Upload CSV":
+        st.subheader("📜 Rules for Uploading CSV")
+        st.markdown("""
     - The file must be in **CSV format** (.csv).
     - Ensure there is **at least one numeric column**.
     - The application will automatically detect numeric columns.
     - If the CSV has missing values, they will be ignored.
     """)
 
-# Input for data or generation of random data
-data = []
-if data_source == "Enter Data":
-    user_data = st.sidebar.text_area("Enter Data (comma-separated)", value="10, 20, 30, 40, 50")
-    data = list(map(float, user_data.split(',')))
-elif data_source == "Generate Random":
-    data = generate_random_data()
-    st.write("Generated Random Data:", data)
-elif data_source == "Upload CSV":
-    uploaded_file = st.sidebar.file_uploader("Upload a CSV File", type=["csv"])
-    if uploaded_file:
-        df = pd.read_csv(uploaded_file)
-        st.write("CSV Data Preview:", df.head())
-        numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        if not numeric_columns:
-            st.error("❌ No numeric columns found. Please upload a valid CSV file.")
-        else:
-            selected_column = st.sidebar.selectbox("Select Numeric Column", numeric_columns)
-            data = df[selected_column].dropna().tolist()
+    # Input for data or generation of random data
+    data = []
+    if data_source == "Enter Data":
+        user_data = st.sidebar.text_area("Enter Data (comma-separated)", value="10, 20, 30, 40, 50")
+        data = list(map(float, user_data.split(',')))
+    elif data_source == "Generate Random":
+        data = generate_random_data()
+        st.write("Generated Random Data:", data)
+    elif data_source == "Upload CSV":
+        uploaded_file = st.sidebar.file_uploader("Upload a CSV File", type=["csv"])
+        if uploaded_file:
+            df = pd.read_csv(uploaded_file)
+            st.write("CSV Data Preview:", df.head())
+            numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
+            if not numeric_columns:
+                st.error("❌ No numeric columns found. Please upload a valid CSV file.")
+            else:
+                selected_column = st.sidebar.selectbox("Select Numeric Column", numeric_columns)
+                data = df[selected_column].dropna().tolist()
 
-# Input for the number of bins
-num_bins = st.sidebar.number_input("Number of Bins", min_value=1, max_value=20, value=5, step=1)
+    # Input for the number of bins
+    num_bins = st.sidebar.number_input("Number of Bins", min_value=1, max_value=20, value=5, step=1)
 
-# Perform binning and display the results
-if st.sidebar.button("Perform Binning") and data:
-    st.subheader("Binning Results")
-    if binning_type == "Equal Width":
-        bins, binned_data = equal_width_binning(data, num_bins)
-        for i, bin_range in enumerate(bins):
-            st.write(f"Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f}): {binned_data[f'Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f})']}")
-    else:
-        bin_ranges, binned_data = equal_depth_binning(data, num_bins)
-        for i, bin_range in enumerate(bin_ranges):
-            st.write(f"Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f}): {binned_data[f'Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f})']}")
+    # Perform binning and display the results
+    if st.sidebar.button("Perform Binning") and data:
+        st.subheader("Binning Results")
+        if binning_type == "Equal Width":
+            with span("binning"):
+                bins, binned_data = equal_width_binning(data, num_bins)
+            for i, bin_range in enumerate(bins):
+                st.write(f"Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f}): {binned_data[f'Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f})']}")
+        else:
+            with span("binning"):
+                bin_ranges, binned_data = equal_depth_binning(data, num_bins)
+            for i, bin_range in enumerate(bin_ranges):
+                st.write(f"Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f}): {binned_data[f'Bin {i+1} ({bin_range[0]:.2f} - {bin_range[1]:.2f})']}")
+
+        # Plot histogram
+        with span("histogram"):
+            plot_histogram(data, num_bins, binning_type)
 
-    # Plot histogram
-    plot_histogram(data, num_bins, binning_type)
+        # Download results as CSV
+        bin_df = pd.DataFrame([(bin_label, values) for bin_label, values in binned_data.items()], columns=["Bin", "Values"])
+        csv_output = get_csv_download_link(bin_df)
+        st.download_button("Download Binned Data", csv_output, "binned_data.csv", "text/csv")
 
-    # Download results as CSV
-    bin_df = pd.DataFrame([(bin_label, values) for bin_label, values in binned_data.items()], columns=["Bin", "Values"])
-    csv_output = get_csv_download_link(bin_df)
-    st.download_button("Download Binned Data", csv_output, "binned_data.csv", "text/csv")
+if __name__ == "__main__":
+    with page("bin"):
+        main()
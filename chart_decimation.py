@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+# Resample rules by resolution name; month-start labels work across pandas versions
+RESAMPLE_RULES = {"Daily": None, "Weekly": "W-FRI", "Monthly": "MS"}
+BARS_PER_PERIOD = {"Daily": 1, "Weekly": 5, "Monthly": 21}
+PX_PER_CANDLE = 3
+
+
+# Coarsest resolution needed so candles stay at least a few pixels wide
+def choose_resolution(n_bars, chart_width=1200):
+    max_candles = max(chart_width // PX_PER_CANDLE, 1)
+    for resolution in ["Daily", "Weekly", "Monthly"]:
+        if n_bars / BARS_PER_PERIOD[resolution] <= max_candles:
+            return resolution
+    return "Monthly"
+
+
+# Aggregate daily OHLCV bars into weekly or monthly candles
+def resample_ohlcv(df, resolution):
+    rule = RESAMPLE_RULES[resolution]
+    if rule is None:
+        return df
+    agg = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+    return df.resample(rule).agg({k: v for k, v in agg.items() if k in df.columns}).dropna(subset=["Close"])
+
+
+# Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the line's visual shape
+def lttb_indices(x, y, threshold):
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+# Downsample a datetime-indexed line series to at most `threshold` points
+def decimate_series(series, threshold):
+    series = series.dropna()
+    if len(series) <= threshold:
+        return series
+    x = series.index.asi8 / 1e9 if isinstance(series.index, pd.DatetimeIndex) else np.arange(len(series))
+    return series.iloc[lttb_indices(x, series.to_numpy(), threshold)]
+
+
+# Size of the JSON Plotly ships to the browser for one figure
+def payload_size(fig):
+    return len(fig.to_json().encode("utf-8"))
+
+
+def format_bytes(n):
+    for unit in ["B", "KB", "MB"]:
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
@@ -4,11 +4,19 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.cluster import KMeans
 from sklearn.datasets import make_blobs
+from profiling import page, span
+
+# Inertia for each number of clusters, used by the elbow plot
+def elbow_sweep(X, k_range, random_state=0):
+    distortions = []
+    for k in k_range:
+        kmeans = KMeans(n_clusters=k, random_state=random_state, n_init=10)
+        kmeans.fit(X)
+        distortions.append(kmeans.inertia_)
+    return distortions
 
 # Streamlit App
 def main():
-    st.set_page_config(page_title="K-Means Clustering", layout="wide")
-
     # Main title
     st.title("🔍 K-Means Clustering Visualization")
     st.write("This app demonstrates K-Means clustering on randomly generated data.")
@@ -21,27 +29,30 @@ def main():
     random_state = st.sidebar.slider("Random State", 0, 100, 0)
 
     # Generate dataset
-    X, _ = make_blobs(n_samples=n_samples, centers=n_clusters, cluster_std=cluster_std, random_state=random_state)
+    with span("generate data"):
+        X, _ = make_blobs(n_samples=n_samples, centers=n_clusters, cluster_std=cluster_std, random_state=random_state)
 
     # Apply KMeans
-    kmeans = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
-    kmeans.fit(X)
-    y_kmeans = kmeans.predict(X)
-    centers = kmeans.cluster_centers_
+    with span("kmeans fit"):
+        kmeans = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
+        kmeans.fit(X)
+        y_kmeans = kmeans.predict(X)
+        centers = kmeans.cluster_centers_
 
     # Layout: Two columns
     col1, col2 = st.columns([2, 1])
 
     with col1:
         st.subheader("📊 Cluster Visualization")
-        fig, ax = plt.subplots(figsize=(7, 5))
-        ax.scatter(X[:, 0], X[:, 1], c=y_kmeans, s=50, cmap='viridis', alpha=0.7, edgecolors='k')
-        ax.scatter(centers[:, 0], centers[:, 1], c='red', s=200, alpha=0.75, marker='X', label="Centroids")
-        ax.set_title("K-Means Clustering")
-        ax.set_xlabel("Feature 1")
-        ax.set_ylabel("Feature 2")
-        ax.legend()
-        st.pyplot(fig)
+        with span("cluster chart"):
+            fig, ax = plt.subplots(figsize=(7, 5))
+            ax.scatter(X[:, 0], X[:, 1], c=y_kmeans, s=50, cmap='viridis', alpha=0.7, edgecolors='k')
+            ax.scatter(centers[:, 0], centers[:, 1], c='red', s=200, alpha=0.75, marker='X', label="Centroids")
+            ax.set_title("K-Means Clustering")
+            ax.set_xlabel("Feature 1")
+            ax.set_ylabel("Feature 2")
+            ax.legend()
+            st.pyplot(fig)
 
     with col2:
         st.subheader("📈 Cluster Information")
@@ -58,12 +69,9 @@ def main():
 
     # Elbow Method (optional)
     st.subheader("📌 Elbow Method for Optimal Clusters")
-    distortions = []
     K_range = range(1, 11)
-    for k in K_range:
-        kmeans = KMeans(n_clusters=k, random_state=random_state, n_init=10)
-        kmeans.fit(X)
-        distortions.append(kmeans.inertia_)
+    with span("elbow sweep"):
+        distortions = elbow_sweep(X, K_range, random_state)
 
     fig, ax = plt.subplots()
     ax.plot(K_range, distortions, marker='o', linestyle='-', color='b')
@@ -73,4 +81,7 @@ def main():
     st.pyplot(fig)
 
 if __name__ == "__main__":
-    main()
+    # Page config must come before any element, including the profiling toggle
+    st.set_page_config(page_title="K-Means Clustering", layout="wide")
+    with page("clustering"):
+        main()
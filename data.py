@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import io
+from profiling import page, span
 
 # Predefined Sample CSVs with Imperfections
 sample_data = {
@@ -35,15 +36,23 @@ sample_data = {
     }),
 }
 
-# Title
-st.title('🧹 Data Cleaning Assistant')
+# Cleaning pass: drop or fill missing values, optionally remove duplicate rows
+def clean_data(data, action='Drop rows', fill_value='0', remove_duplicates=False):
+    data = data.dropna() if action == 'Drop rows' else data.fillna(fill_value)
+    if remove_duplicates:
+        data = data.drop_duplicates()
+    return data
 
-# Sidebar: Choose between Uploading or Selecting Sample Data
-option = st.selectbox("Choose Data Source:", ["Use Sample Data","Upload CSV"])
+def main():
+    # Title
+    st.title('🧹 Data Cleaning Assistant')
 
-# Display CSV Rules if 'Upload CSV' is selected
-if option == "Upload CSV":
-    st.markdown("""
+    # Sidebar: Choose between Uploading or Selecting Sample Data
+    option = st.selectbox("Choose Data Source:", ["Use Sample Data","Upload CSV"])
+
+    # Display CSV Rules if 'Upload CSV' is selected
+    if option == "Upload CSV":
+        st.markdown("""
     ### 📌 Rules for Uploading CSV:
     - File must be **CSV or Excel** format.
     - Column names should be **consistent and clear**.
@@ -52,103 +61,111 @@ if option == "Upload CSV":
     - Ensure data is clean and structured.
     """)
 
-# File uploader
-uploaded_file = None
-if option == "Upload CSV":
-    uploaded_file = st.file_uploader("📂 Choose a file", type=['csv', 'xlsx'])
-
-# Load predefined data
-if option == "Use Sample Data":
-    selected_sample = st.selectbox("Choose a sample dataset:", list(sample_data.keys()))
-    data = sample_data[selected_sample]
-else:
-    if uploaded_file:
-        if uploaded_file.name.endswith('.csv'):
-            data = pd.read_csv(uploaded_file)
+    # File uploader
+    uploaded_file = None
+    if option == "Upload CSV":
+        uploaded_file = st.file_uploader("📂 Choose a file", type=['csv', 'xlsx'])
+
+    # Load predefined data
+    if option == "Use Sample Data":
+        selected_sample = st.selectbox("Choose a sample dataset:", list(sample_data.keys()))
+        data = sample_data[selected_sample]
+    else:
+        if uploaded_file:
+            with span("load"):
+                if uploaded_file.name.endswith('.csv'):
+                    data = pd.read_csv(uploaded_file)
+                else:
+                    data = pd.read_excel(uploaded_file)
         else:
-            data = pd.read_excel(uploaded_file)
+            st.warning("Please upload a file to proceed.")
+            st.stop()
+
+    # Display dataset preview
+    st.subheader('📊 Dataset Preview')
+    st.write(data.head())
+
+    # Data Summary
+    st.subheader('📋 Data Summary')
+    with span("summary"):
+        st.write(data.describe())
+        st.write("Missing Values Count:")
+        st.write(data.isnull().sum())
+
+    # Data Visualization
+    st.subheader('📈 Data Visualization')
+    col_to_plot = st.selectbox("Select a column to visualize", data.columns)
+
+    with span("column chart"):
+        fig, ax = plt.subplots()
+        if data[col_to_plot].dtype in ['int64', 'float64']:
+            ax.hist(data[col_to_plot].dropna(), bins=20, color='blue', edgecolor='black')  
+            ax.set_title(f'Distribution of {col_to_plot}')
+            ax.set_xlabel(col_to_plot)
+            ax.set_ylabel("Frequency")
+        else:
+            data[col_to_plot].value_counts().plot(kind='bar', ax=ax, color='green')
+            ax.set_title(f'Count of {col_to_plot}')
+            ax.set_xlabel(col_to_plot)
+            ax.set_ylabel("Count")
+
+        st.pyplot(fig)
+
+    # Handling Missing Values
+    st.subheader('🚀 Handle Missing Values')
+    action = st.selectbox('Choose an action:', ['Drop rows', 'Fill with value'])
+    fill_value = st.text_input("Enter value to fill missing data:", '0') if action == 'Fill with value' else None
+
+    # Removing Duplicates
+    remove_duplicates = st.checkbox("Remove Duplicates")
+
+    with span("clean"):
+        data = clean_data(data, action, fill_value, remove_duplicates)
+    if action == 'Drop rows':
+        st.success("Missing values dropped!")
+    else:
+        st.success(f"Missing values filled with {fill_value}.")
+    if remove_duplicates:
+        st.success("Duplicate rows removed!")
+
+    # Change Data Type
+    st.subheader('🔄 Change Data Type')
+    col_name = st.selectbox("Select a column to change its type", data.columns)
+    dtype = st.selectbox("New Data Type", ['int64', 'float64', 'object'])
+    if st.button("Convert Type"):
+        try:
+            data[col_name] = data[col_name].astype(dtype)
+            st.success(f'Column {col_name} converted to {dtype}!')
+        except ValueError as e:
+            st.error(f"Error converting column: {e}")
+
+    # Search & Replace
+    st.subheader("🔍 Search & Replace Values")
+    search_col = st.selectbox("Select Column", data.columns)
+    search_val = st.text_input("Search for value")
+    replace_val = st.text_input("Replace with")
+    if st.button("Replace"):
+        data[search_col] = data[search_col].replace(search_val, replace_val)
+        st.success(f"Replaced '{search_val}' with '{replace_val}' in {search_col}!")
+
+    # Cleaned Data Preview
+    st.subheader('📝 Cleaned Data Preview')
+    st.write(data.head())
+
+    # Exporting Cleaned Data
+    st.subheader("📤 Download Cleaned Data")
+    file_format = st.selectbox("Choose Format", ["CSV", "Excel"])
+    if file_format == "CSV":
+        csv_data = data.to_csv(index=False).encode()
+        st.download_button("Download CSV", csv_data, "cleaned_data.csv", "text/csv")
     else:
-        st.warning("Please upload a file to proceed.")
-        st.stop()
-
-# Display dataset preview
-st.subheader('📊 Dataset Preview')
-st.write(data.head())
-
-# Data Summary
-st.subheader('📋 Data Summary')
-st.write(data.describe())
-st.write("Missing Values Count:")
-st.write(data.isnull().sum())
-
-# Data Visualization
-st.subheader('📈 Data Visualization')
-col_to_plot = st.selectbox("Select a column to visualize", data.columns)
-
-fig, ax = plt.subplots()
-if data[col_to_plot].dtype in ['int64', 'float64']:
-    ax.hist(data[col_to_plot].dropna(), bins=20, color='blue', edgecolor='black')  
-    ax.set_title(f'Distribution of {col_to_plot}')
-    ax.set_xlabel(col_to_plot)
-    ax.set_ylabel("Frequency")
-else:
-    data[col_to_plot].value_counts().plot(kind='bar', ax=ax, color='green')
-    ax.set_title(f'Count of {col_to_plot}')
-    ax.set_xlabel(col_to_plot)
-    ax.set_ylabel("Count")
-
-st.pyplot(fig)
-
-# Handling Missing Values
-st.subheader('🚀 Handle Missing Values')
-action = st.selectbox('Choose an action:', ['Drop rows', 'Fill with value'])
-if action == 'Drop rows':
-    data.dropna(inplace=True)
-    st.success("Missing values dropped!")
-else:
-    fill_value = st.text_input("Enter value to fill missing data:", '0')
-    data.fillna(fill_value, inplace=True)
-    st.success(f"Missing values filled with {fill_value}.")
-
-# Removing Duplicates
-if st.checkbox("Remove Duplicates"):
-    data.drop_duplicates(inplace=True)
-    st.success("Duplicate rows removed!")
-
-# Change Data Type
-st.subheader('🔄 Change Data Type')
-col_name = st.selectbox("Select a column to change its type", data.columns)
-dtype = st.selectbox("New Data Type", ['int64', 'float64', 'object'])
-if st.button("Convert Type"):
-    try:
-        data[col_name] = data[col_name].astype(dtype)
-        st.success(f'Column {col_name} converted to {dtype}!')
-    except ValueError as e:
-        st.error(f"Error converting column: {e}")
-
-# Search & Replace
-st.subheader("🔍 Search & Replace Values")
-search_col = st.selectbox("Select Column", data.columns)
-search_val = st.text_input("Search for value")
-replace_val = st.text_input("Replace with")
-if st.button("Replace"):
-    data[search_col] = data[search_col].replace(search_val, replace_val)
-    st.success(f"Replaced '{search_val}' with '{replace_val}' in {search_col}!")
-
-# Cleaned Data Preview
-st.subheader('📝 Cleaned Data Preview')
-st.write(data.head())
-
-# Exporting Cleaned Data
-st.subheader("📤 Download Cleaned Data")
-file_format = st.selectbox("Choose Format", ["CSV", "Excel"])
-if file_format == "CSV":
-    csv_data = data.to_csv(index=False).encode()
-    st.download_button("Download CSV", csv_data, "cleaned_data.csv", "text/csv")
-else:
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        data.to_excel(writer, index=False, sheet_name='Cleaned Data')
-        writer._save()
-    st.download_button("Download Excel", output.getvalue(), "cleaned_data.xlsx", 
-                       "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        output = io.BytesIO()
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+            data.to_excel(writer, index=False, sheet_name='Cleaned Data')
+            writer._save()
+        st.download_button("Download Excel", output.getvalue(), "cleaned_data.xlsx", 
+                           "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+
+if __name__ == "__main__":
+    with page("data"):
+        main()
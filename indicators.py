@@ -0,0 +1,217 @@
+import copy
+import math
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+# Trailing mean over up to `window` bars (matches rolling(window, min_periods=1))
+def moving_average(close, window):
+    return close.rolling(window=window, min_periods=1).mean()
+
+
+# Wilder-smoothed average: simple mean of the first `period` values, then
+# avg = avg + (x - avg) / period for every later bar
+def wilder_mean(values, period):
+    seeded = values.copy() * np.nan
+    if len(values) > period:
+        seeded.iloc[period] = values.iloc[1:period + 1].mean()
+        seeded.iloc[period + 1:] = values.iloc[period + 1:].to_numpy()
+    return seeded.ewm(alpha=1 / period, adjust=False).mean()
+
+
+# RSI with Wilder smoothing over one close series
+def wilder_rsi(close, period=14):
+    delta = close.diff()
+    avg_gain = wilder_mean(delta.clip(lower=0), period)
+    avg_loss = wilder_mean(-delta.clip(upper=0), period)
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+# +1 where the short MA crosses above the long MA, -1 where it crosses below
+def crossover_signals(short_ma, long_ma):
+    buy = (short_ma > long_ma) & (short_ma.shift(1) <= long_ma.shift(1))
+    sell = (short_ma < long_ma) & (short_ma.shift(1) >= long_ma.shift(1))
+    return buy.astype(int) - sell.astype(int)
+
+
+# Full recompute of every indicator over the whole history
+def compute_indicators(close, short_window=50, long_window=200, rsi_period=14):
+    short_ma = moving_average(close, short_window)
+    long_ma = moving_average(close, long_window)
+    return {
+        "short_ma": short_ma,
+        "long_ma": long_ma,
+        "rsi": wilder_rsi(close, rsi_period),
+        "signal": crossover_signals(short_ma, long_ma),
+    }
+
+
+class IndicatorState:
+    """Rolling indicator state for one symbol, updated in O(1) per appended bar.
+
+    Keeps running window sums for both moving averages, Wilder gain/loss
+    averages for RSI and the previous MA pair for crossover detection. Values
+    match `compute_indicators` on the same history to floating-point tolerance.
+    """
+
+    def __init__(self, short_window=50, long_window=200, rsi_period=14):
+        self.short_window = short_window
+        self.long_window = long_window
+        self.rsi_period = rsi_period
+        self.short_bars = deque()
+        self.long_bars = deque()
+        self.short_sum = 0.0
+        self.long_sum = 0.0
+        self.prev_close = None
+        self.n_deltas = 0
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.avg_gain = math.nan
+        self.avg_loss = math.nan
+        self.prev_short_ma = math.nan
+        self.prev_long_ma = math.nan
+        self.last_signal = 0
+        self.last_signal_time = None
+        self.first_time = None
+        self.last_time = None
+        self.latest = {}
+
+    def _push(self, bars, total, window, close):
+        bars.append(close)
+        total += close
+        if len(bars) > window:
+            total -= bars.popleft()
+        return total
+
+    def _rsi(self, close):
+        if self.prev_close is None:
+            return math.nan
+        delta = close - self.prev_close
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self.n_deltas += 1
+        period = self.rsi_period
+        if self.n_deltas < period:
+            self.gain_sum += gain
+            self.loss_sum += loss
+            return math.nan
+        if self.n_deltas == period:
+            self.avg_gain = (self.gain_sum + gain) / period
+            self.avg_loss = (self.loss_sum + loss) / period
+        else:
+            self.avg_gain += (gain - self.avg_gain) / period
+            self.avg_loss += (loss - self.avg_loss) / period
+        if self.avg_loss == 0:
+            return math.nan if self.avg_gain == 0 else 100.0
+        return 100 - 100 / (1 + self.avg_gain / self.avg_loss)
+
+    def update(self, close, timestamp=None):
+        close = float(close)
+        self.short_sum = self._push(self.short_bars, self.short_sum, self.short_window, close)
+        self.long_sum = self._push(self.long_bars, self.long_sum, self.long_window, close)
+        short_ma = self.short_sum / len(self.short_bars)
+        long_ma = self.long_sum / len(self.long_bars)
+        rsi = self._rsi(close)
+
+        signal = 0
+        if short_ma > long_ma and self.prev_short_ma <= self.prev_long_ma:
+            signal = 1
+        elif short_ma < long_ma and self.prev_short_ma >= self.prev_long_ma:
+            signal = -1
+        if signal:
+            self.last_signal, self.last_signal_time = signal, timestamp
+
+        self.prev_close = close
+        self.prev_short_ma, self.prev_long_ma = short_ma, long_ma
+        if self.first_time is None:
+            self.first_time = timestamp
+        self.last_time = timestamp
+        self.latest = {"close": close, "short_ma": short_ma, "long_ma": long_ma, "rsi": rsi, "signal": signal}
+        return self.latest
+
+    @classmethod
+    def from_history(cls, close, short_window=50, long_window=200, rsi_period=14):
+        """Seed state from a full history using the vectorized computation."""
+        state = cls(short_window, long_window, rsi_period)
+        close = close.dropna().astype(float)
+        if close.empty:
+            return state
+        ind = compute_indicators(close, short_window, long_window, rsi_period)
+        values = close.to_numpy()
+
+        state.short_bars = deque(values[-short_window:].tolist())
+        state.long_bars = deque(values[-long_window:].tolist())
+        state.short_sum = float(sum(state.short_bars))
+        state.long_sum = float(sum(state.long_bars))
+        state.prev_close = float(values[-1])
+        state.n_deltas = len(values) - 1
+        if state.n_deltas >= rsi_period:
+            delta = close.diff()
+            state.avg_gain = float(wilder_mean(delta.clip(lower=0), rsi_period).iloc[-1])
+            state.avg_loss = float(wilder_mean(-delta.clip(upper=0), rsi_period).iloc[-1])
+        else:
+            deltas = np.diff(values)
+            state.gain_sum = float(np.clip(deltas, 0, None).sum())
+            state.loss_sum = float(np.clip(-deltas, 0, None).sum())
+        state.prev_short_ma = float(ind["short_ma"].iloc[-1])
+        state.prev_long_ma = float(ind["long_ma"].iloc[-1])
+
+        signals = ind["signal"][ind["signal"] != 0]
+        if not signals.empty:
+            state.last_signal, state.last_signal_time = int(signals.iloc[-1]), signals.index[-1]
+        state.first_time = close.index[0]
+        state.last_time = close.index[-1]
+        state.latest = {
+            "close": state.prev_close,
+            "short_ma": state.prev_short_ma,
+            "long_ma": state.prev_long_ma,
+            "rsi": float(ind["rsi"].iloc[-1]),
+            "signal": int(ind["signal"].iloc[-1]),
+        }
+        return state
+
+
+class IndicatorEngine:
+    """Per-symbol indicator states that only process bars newer than the last seen.
+
+    The first call for a symbol seeds its state from the full history; later
+    calls with a longer series apply O(1) updates for the appended bars only.
+    The latest bar is applied to a copy of the state, so an intraday refresh
+    that revises today's close replaces it instead of appending it twice.
+    A series starting on another date, or one that no longer reaches past the
+    settled bars, reseeds the symbol. Safe to share between sessions.
+    """
+
+    def __init__(self, short_window=50, long_window=200, rsi_period=14):
+        self.params = (short_window, long_window, rsi_period)
+        self.settled = {}
+        self.states = {}
+        self.lock = threading.Lock()
+
+    def state(self, symbol, close):
+        close = close.dropna().astype(float)
+        if close.empty:
+            return IndicatorState(*self.params)
+        with self.lock:
+            settled = self.settled.get(symbol)
+            if settled is None or settled.first_time != close.index[0] or close.index[-1] <= settled.last_time:
+                settled = IndicatorState.from_history(close.iloc[:-1], *self.params)
+            elif settled.last_time is not None:
+                for timestamp, value in close.iloc[:-1][close.index[:-1] > settled.last_time].items():
+                    settled.update(value, timestamp)
+            state = copy.deepcopy(settled)
+            state.update(close.iloc[-1], close.index[-1])
+            self.settled[symbol], self.states[symbol] = settled, state
+            return state
+
+    def update(self, symbol, close):
+        return self.state(symbol, close).latest
+
+    def snapshot(self):
+        rows = {
+            symbol: {**state.latest, "last_signal": state.last_signal, "last_signal_time": state.last_signal_time}
+            for symbol, state in self.states.items()
+        }
+        return pd.DataFrame.from_dict(rows, orient="index")
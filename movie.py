@@ -1,17 +1,16 @@
 import streamlit as st
 import pandas as pd
 import random
-
-# Load the dataset
-movies = pd.read_csv("movies.csv")
+from shared import load_movies
+from profiling import page, span
 
 # Function to get recommendations based on genre
-def get_movies_by_genre(selected_genre):
+def get_movies_by_genre(movies, selected_genre):
     filtered_movies = movies[movies['genres'].str.contains(selected_genre, case=False, na=False)]
     return filtered_movies.sample(min(5, len(filtered_movies)))
 
 # Function to find similar movies by title
-def get_similar_movies(movie_title):
+def get_similar_movies(movies, movie_title):
     movie = movies[movies['title'].str.contains(movie_title, case=False, na=False)]
     if not movie.empty:
         genres = movie.iloc[0]['genres'].split('|')
@@ -19,33 +18,47 @@ def get_similar_movies(movie_title):
         return related_movies.sample(min(5, len(related_movies)))
     return pd.DataFrame()
 
-# Streamlit UI
-st.title("🎬 Movie Recommendation System")
-st.sidebar.header("Choose an Option")
-
-# Search by Genre
-st.sidebar.subheader("Find Movies by Genre")
-genres_list = set("|".join(movies['genres'].dropna()).split('|'))
-selected_genre = st.sidebar.selectbox("Select a genre", ["Select"] + sorted(genres_list))
-
-if selected_genre != "Select":
-    st.subheader(f"Recommended {selected_genre} Movies:")
-    st.table(get_movies_by_genre(selected_genre))
-
-# Search by Movie Title
-st.sidebar.subheader("Find Similar Movies")
-movie_search = st.sidebar.text_input("Enter movie title")
-if movie_search:
-    st.subheader(f"Movies Similar to '{movie_search}':")
-    results = get_similar_movies(movie_search)
-    if not results.empty:
-        st.table(results)
-    else:
-        st.write("No similar movies found.")
-
-# Random Movie Suggestion
-st.sidebar.subheader("Surprise Me!")
-if st.sidebar.button("Get a Random Movie"):
-    random_movie = movies.sample(1)
-    st.subheader("Here's a Movie for You:")
-    st.write(random_movie[['title', 'genres']])
+# Sorted list of every genre in the pipe-separated genres column
+def genre_list(movies):
+    return sorted(set("|".join(movies['genres'].dropna()).split('|')))
+
+def main():
+    # Load the dataset
+    with span("load movies"):
+        movies = load_movies("movies.csv")
+
+    # Streamlit UI
+    st.title("🎬 Movie Recommendation System")
+    st.sidebar.header("Choose an Option")
+
+    # Search by Genre
+    st.sidebar.subheader("Find Movies by Genre")
+    selected_genre = st.sidebar.selectbox("Select a genre", ["Select"] + genre_list(movies))
+
+    if selected_genre != "Select":
+        st.subheader(f"Recommended {selected_genre} Movies:")
+        with span("genre lookup"):
+            st.table(get_movies_by_genre(movies, selected_genre))
+
+    # Search by Movie Title
+    st.sidebar.subheader("Find Similar Movies")
+    movie_search = st.sidebar.text_input("Enter movie title")
+    if movie_search:
+        st.subheader(f"Movies Similar to '{movie_search}':")
+        with span("similar movies"):
+            results = get_similar_movies(movies, movie_search)
+        if not results.empty:
+            st.table(results)
+        else:
+            st.write("No similar movies found.")
+
+    # Random Movie Suggestion
+    st.sidebar.subheader("Surprise Me!")
+    if st.sidebar.button("Get a Random Movie"):
+        random_movie = movies.sample(1)
+        st.subheader("Here's a Movie for You:")
+        st.write(random_movie[['title', 'genres']])
+
+if __name__ == "__main__":
+    with page("movie"):
+        main()
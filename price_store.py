@@ -0,0 +1,238 @@
+import json
+import os
+import re
+import tempfile
+from datetime import date, timedelta
+
+import numpy as np
+
+import pandas as pd
+
+DEFAULT_STORE_PATH = os.path.join(".cache", "prices")
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+# Tickers such as BRK.B, ^GSPC, EURUSD=X and BTC-USD; anything else could escape the store root
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9.^=-]+$")
+
+
+def normalize_symbol(symbol):
+    symbol = symbol.strip().upper()
+    if not SYMBOL_PATTERN.match(symbol) or set(symbol) == {"."}:
+        raise ValueError(f"Invalid symbol: {symbol!r}")
+    return symbol
+
+
+# Yahoo Finance returns (field, ticker) columns for some versions; keep the field level only
+def _flatten_columns(df):
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.copy()
+        df.columns = df.columns.get_level_values(0)
+    return df
+
+
+class YahooProvider:
+    """Daily OHLCV bars from Yahoo Finance for the half-open range [start, end).
+
+    Uses `Ticker.history` rather than `yf.download`, which shares module-level
+    state between calls and is not safe to run from several threads at once.
+    Bars are split- and dividend-adjusted as of the fetch, so `PriceStore`
+    re-checks stored bars against a fresh fetch before appending to them.
+    Network and rate-limit failures raise; only a range with genuinely no
+    bars comes back empty.
+    """
+
+    def fetch(self, symbol, start, end):
+        import yfinance as yf
+        from yfinance.exceptions import YFPricesMissingError
+
+        try:
+            df = _flatten_columns(yf.Ticker(symbol).history(start=start, end=end, raise_errors=True))
+        except YFPricesMissingError:
+            df = pd.DataFrame()
+        if df.empty:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        df.index = df.index.tz_localize(None) if df.index.tz is not None else df.index
+        return df[[c for c in OHLCV_COLUMNS if c in df.columns]]
+
+
+class LocalFileProvider:
+    """Offline stand-in for Yahoo that serves bars from `<root>/<SYMBOL>.csv` or `.parquet`.
+
+    Useful for tests and benchmarks where network access is unavailable or
+    fetch latency must be controlled.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def fetch(self, symbol, start, end):
+        parquet_path = os.path.join(self.root, f"{symbol}.parquet")
+        if os.path.exists(parquet_path):
+            df = pd.read_parquet(parquet_path)
+        else:
+            csv_path = os.path.join(self.root, f"{symbol}.csv")
+            if not os.path.exists(csv_path):
+                return pd.DataFrame(columns=OHLCV_COLUMNS)
+            df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+        df.index = pd.to_datetime(df.index)
+        return df[(df.index >= pd.Timestamp(start)) & (df.index < pd.Timestamp(end))]
+
+
+# The stored bar next to a gap: the last one before it, else the first one after it
+def _anchor_bar(stored, gap_start, gap_end):
+    if stored is None or stored.empty:
+        return None
+    before = stored.index[stored.index < pd.Timestamp(gap_start)]
+    if len(before):
+        return before[-1]
+    after = stored.index[stored.index >= pd.Timestamp(gap_end)]
+    return after[0] if len(after) else None
+
+
+# False when a fresh fetch of a stored bar no longer matches it, i.e. the
+# provider re-adjusted history for a split or dividend since it was stored
+def _anchor_matches(stored, fetched, anchor):
+    if anchor not in fetched.index:
+        return True
+    old, new = stored.loc[anchor, "Close"], fetched.loc[anchor, "Close"]
+    return bool(np.isclose(old, new, rtol=1e-6, atol=0))
+
+
+# An empty answer for a settled gap is final when the gap has no weekdays, or
+# when later bars are already stored (a holiday inside known history)
+def _empty_gap_is_final(stored, gap_start, gap_end):
+    if not len(pd.bdate_range(gap_start, gap_end - timedelta(days=1))):
+        return True
+    return stored is not None and not stored.empty and stored.index[-1] >= pd.Timestamp(gap_end)
+
+
+# Merge overlapping or touching [start, end) date intervals
+def _merge_intervals(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+# Parts of [start, end) not covered by the given intervals
+def _missing_ranges(intervals, start, end):
+    missing = []
+    cursor = start
+    for covered_start, covered_end in _merge_intervals(intervals):
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+class PriceStore:
+    """Per-symbol Parquet cache of daily OHLCV bars.
+
+    Each symbol keeps a Parquet file of bars plus a JSON sidecar listing the
+    date ranges already fetched, so later requests only hit the provider for
+    the gaps. Each gap fetch also re-fetches the adjacent stored bar; if its
+    price changed, the provider re-adjusted history (split or dividend) and
+    the symbol is cleared and fetched again, so old and new bars never mix
+    adjustment bases. Ranges reaching today are not marked covered past yesterday,
+    since the current session's bar is still changing. A gap that came back
+    empty is only marked covered when no bars could exist in it (no weekdays,
+    or later bars already stored), so a missing answer is asked for again.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_PATH, provider=None):
+        self.root = root
+        self.provider = provider or YahooProvider()
+        os.makedirs(root, exist_ok=True)
+
+    def _paths(self, symbol):
+        base = os.path.join(self.root, normalize_symbol(symbol))
+        return base + ".parquet", base + ".json"
+
+    def _load(self, symbol):
+        data_path, meta_path = self._paths(symbol)
+        if not os.path.exists(data_path) or not os.path.exists(meta_path):
+            return None, []
+        with open(meta_path) as f:
+            intervals = [[date.fromisoformat(s), date.fromisoformat(e)] for s, e in json.load(f)["covered"]]
+        return pd.read_parquet(data_path), intervals
+
+    # Write to a temp file and swap it in, so concurrent readers never see a partial file
+    def _replace(self, path, write):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _save(self, symbol, df, intervals):
+        data_path, meta_path = self._paths(symbol)
+        meta = {"covered": [[s.isoformat(), e.isoformat()] for s, e in intervals]}
+
+        def write_meta(path):
+            with open(path, "w") as f:
+                json.dump(meta, f)
+
+        # Bars first: a sidecar never claims ranges the Parquet file lacks
+        self._replace(data_path, df.to_parquet)
+        self._replace(meta_path, write_meta)
+
+    def get(self, symbol, start, end):
+        """Return bars for [start, end), fetching only the ranges not yet on disk."""
+        symbol = normalize_symbol(symbol)
+        stored, intervals = self._load(symbol)
+        missing = _missing_ranges(intervals, start, end)
+
+        if missing:
+            frames = [] if stored is None else [stored]
+            filled = []
+            for gap_start, gap_end in missing:
+                anchor = _anchor_bar(stored, gap_start, gap_end)
+                fetch_start, fetch_end = gap_start, gap_end
+                if anchor is not None:
+                    fetch_start = min(fetch_start, anchor.date())
+                    fetch_end = max(fetch_end, anchor.date() + timedelta(days=1))
+                fetched = self.provider.fetch(symbol, fetch_start, fetch_end)
+                if anchor is not None and not _anchor_matches(stored, fetched, anchor):
+                    self.clear(symbol)
+                    return self.get(symbol, start, end)
+                gap_rows = fetched[(fetched.index >= pd.Timestamp(gap_start)) & (fetched.index < pd.Timestamp(gap_end))]
+                if not gap_rows.empty:
+                    frames.append(gap_rows)
+                    filled.append((gap_start, gap_end))
+                elif _empty_gap_is_final(stored, gap_start, gap_end):
+                    filled.append((gap_start, gap_end))
+            if frames:
+                merged = pd.concat(frames)
+                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+            else:
+                merged = pd.DataFrame(columns=OHLCV_COLUMNS)
+            settled = date.today()
+            covered = [(s, min(e, settled)) for s, e in filled if s < settled]
+            if filled:
+                intervals = _merge_intervals(intervals + [list(c) for c in covered])
+                self._save(symbol, merged, intervals)
+            stored = merged
+
+        if stored is None or stored.empty:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return stored[(stored.index >= pd.Timestamp(start)) & (stored.index < pd.Timestamp(end))]
+
+    def clear(self, symbol=None):
+        symbols = [normalize_symbol(symbol)] if symbol else {
+            os.path.splitext(n)[0] for n in os.listdir(self.root) if n.endswith((".parquet", ".json"))
+        }
+        for name in symbols:
+            for path in self._paths(name):
+                if os.path.exists(path):
+                    os.remove(path)
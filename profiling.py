@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+ENV_FLAG = "DATAVERSE_PROFILE"
+
+_state = threading.local()
+_NULL_SPAN = nullcontext()
+# tracemalloc is process-wide: it runs while any session is recording
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+
+
+class Recorder:
+    """Spans recorded during one script run of one page."""
+
+    def __init__(self, label):
+        self.label = label
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.stack = []
+
+
+def active_recorder():
+    return getattr(_state, "recorder", None)
+
+
+def span(name):
+    """Time a stage: wall time, CPU time and peak traced allocation.
+
+    Returns a shared no-op context when profiling is off, so instrumented
+    code costs one attribute lookup per stage.
+    """
+    recorder = getattr(_state, "recorder", None)
+    if recorder is None:
+        return _NULL_SPAN
+    return _span(recorder, name)
+
+
+@contextmanager
+def _span(recorder, name):
+    entry = {"name": name, "depth": len(recorder.stack), "child_peak": 0}
+    if recorder.stack:
+        # reset_peak() below would erase the parent's peak so far; keep it for the parent
+        parent = recorder.stack[-1]
+        parent["child_peak"] = max(parent["child_peak"], tracemalloc.get_traced_memory()[1])
+    recorder.stack.append(entry)
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall_end, cpu_end = time.perf_counter(), time.process_time()
+        # Children reset the peak counter, so fold their peaks back into ours
+        peak = max(tracemalloc.get_traced_memory()[1], entry.pop("child_peak"))
+        recorder.stack.pop()
+        if recorder.stack:
+            parent = recorder.stack[-1]
+            parent["child_peak"] = max(parent["child_peak"], peak)
+        entry.update(
+            start_s=wall_start - recorder.origin,
+            wall_s=wall_end - wall_start,
+            cpu_s=cpu_end - cpu_start,
+            peak_bytes=max(peak - base, 0),
+        )
+        recorder.spans.append(entry)
+
+
+def start(label):
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        _tracing_users += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+    recorder = Recorder(label)
+    _state.recorder = recorder
+    return recorder
+
+
+def stop():
+    global _tracing_users, _started_tracing
+    recorder = getattr(_state, "recorder", None)
+    _state.recorder = None
+    if recorder is not None:
+        with _tracing_lock:
+            _tracing_users -= 1
+            # Only stop tracing we started, once the last recording session is done
+            if _tracing_users == 0 and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+    return recorder
+
+
+def to_json(recorder):
+    spans = sorted(recorder.spans, key=lambda s: s["start_s"])
+    return json.dumps({"page": recorder.label, "spans": spans}, indent=2)
+
+
+# Chrome trace event format, viewable in chrome://tracing or Perfetto
+def to_chrome_trace(recorder):
+    pid = os.getpid()
+    events = [
+        {
+            "name": s["name"], "ph": "X", "pid": pid, "tid": 0,
+            "ts": s["start_s"] * 1e6, "dur": s["wall_s"] * 1e6,
+            "args": {"cpu_ms": s["cpu_s"] * 1e3, "peak_bytes": s["peak_bytes"]},
+        }
+        for s in recorder.spans
+    ]
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"page": recorder.label}})
+
+
+def render_panel(recorder, container):
+    import pandas as pd
+    import streamlit as st
+
+    spans = sorted(recorder.spans, key=lambda s: s["start_s"])
+    table = pd.DataFrame({
+        "Stage": [" " * s["depth"] + s["name"] for s in spans],
+        "Wall (ms)": [s["wall_s"] * 1e3 for s in spans],
+        "CPU (ms)": [s["cpu_s"] * 1e3 for s in spans],
+        "Peak (MB)": [s["peak_bytes"] / 2**20 for s in spans],
+    })
+    with container:
+        st.dataframe(table.round(2), hide_index=True, use_container_width=True)
+        st.caption("CPU time is process-wide; peak is memory traced by tracemalloc.")
+        col1, col2 = st.columns(2)
+        col1.download_button("JSON", to_json(recorder), f"{recorder.label}_profile.json", "application/json")
+        col2.download_button("Chrome trace", to_chrome_trace(recorder), f"{recorder.label}_trace.json",
+                             "application/json")
+
+
+@contextmanager
+def page(label):
+    """Profile one page run and show its stages in a collapsible sidebar panel.
+
+    Enabled by the sidebar toggle or by setting DATAVERSE_PROFILE=1. tracemalloc
+    is process-global, so timings from concurrent sessions can overlap.
+    """
+    if active_recorder() is not None:
+        yield
+        return
+    import streamlit as st
+
+    enabled = os.environ.get(ENV_FLAG) == "1" or st.sidebar.toggle("⏱️ Profile stages", key="profile_enabled")
+    if not enabled:
+        yield
+        return
+    panel = st.sidebar.expander("⏱️ Stage Timings", expanded=False)
+    recorder = start(label)
+    try:
+        with _span(recorder, label):
+            yield
+    finally:
+        stop()
+        render_panel(recorder, panel)
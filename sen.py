@@ -1,16 +1,15 @@
 import streamlit as st
 import pandas as pd
-from textblob import TextBlob
 import matplotlib.pyplot as plt
 import seaborn as sns
-import re
-from wordcloud import WordCloud
+from wordcloud import WordCloud, STOPWORDS
 from io import BytesIO
-import json
-
-# Set up Streamlit App
-st.title("Sentiment Analysis App")
-st.markdown("Upload a CSV file with a `text` column or choose a sample dataset.")
+import os
+import numpy as np
+from text_normalizer import tokenize_series, token_frequencies
+from sentiment_stream import stream_sentiment, POLARITY_BINS
+from shared import get_sentiment_cache
+from profiling import page, span
 
 # Prebuilt sample datasets
 def load_sample_data():
@@ -37,82 +36,162 @@ def load_sample_data():
         ]})
     }
 
-sample_data = load_sample_data()
-selected_sample = st.selectbox("Or choose a sample dataset:", list(sample_data.keys()))
-
-uploaded_file = st.file_uploader("Upload a CSV file", type=["csv"])
-
-data = pd.read_csv(uploaded_file) if uploaded_file else sample_data[selected_sample]
-
-if 'text' not in data.columns:
-    st.error("The dataset must contain a 'text' column.")
-    st.stop()
-
-# Text Preprocessing
-def clean_text(text):
-    text = re.sub(r"http\S+", "", text)
-    text = re.sub(r"@\w+", "", text)
-    text = re.sub(r"#\w+", "", text)
-    text = re.sub(r"[^\w\s]", "", text)
-    return text.strip().lower()
-
-data['cleaned_text'] = data['text'].apply(lambda x: clean_text(str(x)))
-
 # Sentiment Analysis
 def analyze_sentiment(text):
+    # Imported on first cache miss only; fully cached datasets never load TextBlob
+    from textblob import TextBlob
     analysis = TextBlob(text)
     polarity = analysis.sentiment.polarity
     subjectivity = analysis.sentiment.subjectivity
     sentiment = "Positive" if polarity > 0 else "Negative" if polarity < 0 else "Neutral"
     return sentiment, polarity, subjectivity
 
-data[['Sentiment', 'Polarity', 'Subjectivity']] = data['cleaned_text'].apply(lambda x: pd.Series(analyze_sentiment(x)))
-
-# Display Results
-st.write("### Sentiment Analysis Results")
-st.write(data)
+# Normalize a column of texts and score it through the sentiment cache
+def score_texts(texts, cache):
+    cleaned, tokens = tokenize_series(texts)
+    scores, cache_stats = cache.score_series(cleaned, analyze_sentiment)
+    return cleaned, tokens, scores, cache_stats
 
 # Sentiment Distribution Visualization
-st.write("### Sentiment Distribution")
-sentiment_counts = data['Sentiment'].value_counts()
-fig, ax = plt.subplots(figsize=(8, 6))
-sns.barplot(x=sentiment_counts.index, y=sentiment_counts.values, palette=['lightgreen', 'gold', 'red'], ax=ax)
-ax.set_title("Sentiment Distribution")
-ax.set_xlabel("Sentiment")
-ax.set_ylabel("Number of Entries")
-st.pyplot(fig)
+def plot_sentiment_counts(sentiment_counts):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    sns.barplot(x=sentiment_counts.index, y=sentiment_counts.values, palette=['lightgreen', 'gold', 'red'], ax=ax)
+    ax.set_title("Sentiment Distribution")
+    ax.set_xlabel("Sentiment")
+    ax.set_ylabel("Number of Entries")
+    st.pyplot(fig)
 
 # Word Cloud Visualization
-def generate_wordcloud(sentiment):
-    text = " ".join(data[data['Sentiment'] == sentiment]['cleaned_text'])
-    if text:
-        wc = WordCloud(background_color='white', max_words=100, colormap='coolwarm').generate(text)
+def generate_wordcloud(frequencies):
+    if frequencies:
+        wc = WordCloud(background_color='white', max_words=100, colormap='coolwarm').generate_from_frequencies(frequencies)
         fig, ax = plt.subplots()
         ax.imshow(wc, interpolation='bilinear')
         ax.axis("off")
         return fig
     return None
 
-st.write("### Word Clouds")
-for sentiment in ["Positive", "Neutral", "Negative"]:
-    st.write(f"**{sentiment} Sentiment**")
-    fig = generate_wordcloud(sentiment)
-    if fig:
-        st.pyplot(fig)
+def show_wordclouds(frequencies_for):
+    st.write("### Word Clouds")
+    for sentiment in ["Positive", "Neutral", "Negative"]:
+        st.write(f"**{sentiment} Sentiment**")
+        fig = generate_wordcloud(frequencies_for(sentiment))
+        if fig:
+            st.pyplot(fig)
+        else:
+            st.write("No words available for this sentiment.")
+
+# Delete the spill file of a previous streamed upload, if any
+def discard_stream_results():
+    previous = st.session_state.pop("sentiment_stream", None)
+    if previous and os.path.exists(previous["spill_path"]):
+        os.remove(previous["spill_path"])
+
+def main():
+    # Set up Streamlit App
+    st.title("Sentiment Analysis App")
+    st.markdown("Upload a CSV file with a `text` column or choose a sample dataset.")
+
+    sample_data = load_sample_data()
+    selected_sample = st.selectbox("Or choose a sample dataset:", list(sample_data.keys()))
+
+    uploaded_file = st.file_uploader("Upload a CSV file", type=["csv"])
+    streaming = uploaded_file is not None and st.checkbox(
+        "Streaming mode (large files)", help="Process the upload in chunks and keep only aggregates in memory.")
+
+    # Streaming Mode: chunked scoring, scored rows spill to a gzipped file on disk.
+    # Results are kept per upload, so reruns (including the download click) do not rescore.
+    if not streaming:
+        discard_stream_results()
     else:
-        st.write("No words available for this sentiment.")
-
-# Export Options
-st.write("### Download Processed Data")
-data_csv = data.to_csv(index=False).encode()
-data_json = data.to_json(orient='records').encode()
-data_excel = BytesIO()
-data.to_excel(data_excel, index=False, engine='openpyxl')
-
-download_format = st.radio("Choose format:", ["CSV", "JSON", "Excel"])
-if download_format == "CSV":
-    st.download_button("Download CSV", data=data_csv, file_name="processed_data.csv", mime="text/csv")
-elif download_format == "JSON":
-    st.download_button("Download JSON", data=data_json, file_name="processed_data.json", mime="application/json")
-elif download_format == "Excel":
-    st.download_button("Download Excel", data=data_excel.getvalue(), file_name="processed_data.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        chunksize = st.number_input("Rows per chunk", min_value=500, max_value=100000, value=5000, step=500)
+        results = st.session_state.get("sentiment_stream")
+        if results is None or results["file_id"] != uploaded_file.file_id:
+            discard_stream_results()
+            progress = st.progress(0.0, text="Scoring chunks...")
+
+            def report_progress(i, aggregates):
+                done = min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0)
+                progress.progress(done, text=f"Chunk {i + 1}: {aggregates.rows} rows scored")
+
+            uploaded_file.seek(0)
+            try:
+                with span("stream"):
+                    aggregates, spill_path = stream_sentiment(uploaded_file, get_sentiment_cache(), analyze_sentiment,
+                                                              chunksize=int(chunksize), stopwords=STOPWORDS,
+                                                              on_chunk=report_progress, compress=True)
+            except ValueError as e:
+                st.error(str(e))
+                return
+            progress.progress(1.0, text=f"Done: {aggregates.rows} rows scored")
+            results = st.session_state["sentiment_stream"] = {
+                "file_id": uploaded_file.file_id, "aggregates": aggregates, "spill_path": spill_path}
+        aggregates = results["aggregates"]
+
+        st.write("### Sentiment Analysis Results")
+        st.caption(f"{aggregates.rows} rows; {aggregates.unique} texts looked up after deduplicating within each chunk, "
+                   f"cache hit rate {aggregates.hits / max(aggregates.unique, 1):.0%}")
+        st.write("### Sentiment Distribution")
+        plot_sentiment_counts(pd.Series(aggregates.sentiment_counts).reindex(["Positive", "Neutral", "Negative"], fill_value=0))
+
+        st.write("### Polarity Distribution")
+        fig, ax = plt.subplots(figsize=(8, 4))
+        ax.bar(POLARITY_BINS[:-1], aggregates.polarity_hist, width=np.diff(POLARITY_BINS), align='edge', edgecolor='black')
+        ax.set_xlabel("Polarity")
+        ax.set_ylabel("Number of Entries")
+        st.pyplot(fig)
+
+        with span("wordclouds"):
+            show_wordclouds(aggregates.top_words)
+
+        st.write("### Download Processed Data")
+        with open(results["spill_path"], "rb") as f:
+            st.download_button("Download CSV (gzip)", data=f, file_name="processed_data.csv.gz",
+                               mime="application/gzip", on_click="ignore")
+        return
+
+    with span("read csv"):
+        data = pd.read_csv(uploaded_file) if uploaded_file else sample_data[selected_sample]
+
+    if 'text' not in data.columns:
+        st.error("The dataset must contain a 'text' column.")
+        st.stop()
+
+    # Text Preprocessing (one vectorized pass over the column, tokens kept for reuse) and scoring;
+    # scores are cached on disk by normalized text, so duplicates and reruns skip TextBlob
+    with span("score"):
+        data['cleaned_text'], tokens, scores, cache_stats = score_texts(data['text'], get_sentiment_cache())
+        data[['Sentiment', 'Polarity', 'Subjectivity']] = scores
+
+    # Display Results
+    st.write("### Sentiment Analysis Results")
+    st.write(data)
+    st.caption(f"{cache_stats['unique']} unique of {cache_stats['rows']} texts "
+               f"(dedup ratio {cache_stats['dedup_ratio']:.0%}), "
+               f"cache hit rate {cache_stats['hit_rate']:.0%}")
+
+    st.write("### Sentiment Distribution")
+    plot_sentiment_counts(data['Sentiment'].value_counts())
+
+    with span("wordclouds"):
+        show_wordclouds(lambda sentiment: token_frequencies(tokens[data['Sentiment'] == sentiment], stopwords=STOPWORDS))
+
+    # Export Options
+    st.write("### Download Processed Data")
+    with span("export"):
+        data_csv = data.to_csv(index=False).encode()
+        data_json = data.to_json(orient='records').encode()
+        data_excel = BytesIO()
+        data.to_excel(data_excel, index=False, engine='openpyxl')
+
+    download_format = st.radio("Choose format:", ["CSV", "JSON", "Excel"])
+    if download_format == "CSV":
+        st.download_button("Download CSV", data=data_csv, file_name="processed_data.csv", mime="text/csv")
+    elif download_format == "JSON":
+        st.download_button("Download JSON", data=data_json, file_name="processed_data.json", mime="application/json")
+    elif download_format == "Excel":
+        st.download_button("Download Excel", data=data_excel.getvalue(), file_name="processed_data.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+
+if __name__ == "__main__":
+    with page("sen"):
+        main()
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "sentiment_cache.sqlite")
+SQL_BATCH = 500
+
+
+# Stable key for a normalized text, namespaced by the scorer that produced it
+def text_key(text, namespace="textblob"):
+    return hashlib.sha1(f"{namespace}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """Persistent LRU store of sentiment scores keyed by normalized text hash.
+
+    Each unique text in a dataset is scored at most once; scores survive
+    reruns and new uploads until the least recently used entries are evicted.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=100_000, namespace="textblob"):
+        self.path = path
+        self.max_entries = max_entries
+        self.namespace = namespace
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "key TEXT PRIMARY KEY, sentiment TEXT, polarity REAL, "
+                "subjectivity REAL, last_used REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used)")
+
+    @contextmanager
+    def _connect(self):
+        # A fresh connection per call keeps the cache safe across Streamlit threads
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _lookup(self, conn, keys):
+        found = {}
+        for i in range(0, len(keys), SQL_BATCH):
+            batch = keys[i:i + SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key, sentiment, polarity, subjectivity FROM scores WHERE key IN ({placeholders})",
+                batch,
+            )
+            for key, sentiment, polarity, subjectivity in rows:
+                found[key] = (sentiment, polarity, subjectivity)
+        return found
+
+    def _evict(self, conn):
+        (count,) = conn.execute("SELECT COUNT(*) FROM scores").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM scores WHERE key IN "
+                "(SELECT key FROM scores ORDER BY last_used ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def score_series(self, texts, scorer):
+        """Score a series of normalized texts, calling `scorer` once per unseen text.
+
+        Returns a DataFrame with Sentiment, Polarity and Subjectivity columns
+        aligned to `texts`, plus a dict of dedup and cache statistics.
+        """
+        texts = pd.Series(texts)
+        unique_texts = texts.unique()
+        keys = [text_key(t, self.namespace) for t in unique_texts]
+        now = time.time()
+
+        with self._connect() as conn:
+            cached = self._lookup(conn, keys)
+            scores = {}
+            new_rows = []
+            for text, key in zip(unique_texts, keys):
+                if key in cached:
+                    scores[text] = cached[key]
+                else:
+                    scores[text] = tuple(scorer(text))
+                    new_rows.append((key, *scores[text], now))
+            conn.executemany(
+                "UPDATE scores SET last_used = ? WHERE key = ?",
+                [(now, key) for key in cached],
+            )
+            conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)", new_rows)
+            self._evict(conn)
+
+        result = pd.DataFrame(
+            [scores[t] for t in texts],
+            index=texts.index,
+            columns=["Sentiment", "Polarity", "Subjectivity"],
+        )
+        stats = {
+            "rows": len(texts),
+            "unique": len(unique_texts),
+            "dedup_ratio": 1 - len(unique_texts) / len(texts) if len(texts) else 0.0,
+            "hits": len(cached),
+            "misses": len(new_rows),
+            "hit_rate": len(cached) / len(unique_texts) if len(unique_texts) else 0.0,
+        }
+        return result, stats
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM scores")
@@ -0,0 +1,79 @@
+import gzip
+import os
+import tempfile
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from text_normalizer import tokenize_series
+
+SENTIMENTS = ["Positive", "Neutral", "Negative"]
+POLARITY_BINS = np.linspace(-1, 1, 21)
+
+
+class StreamingAggregates:
+    """Running totals for a chunked sentiment pass.
+
+    Word counters are pruned after every chunk so memory stays bounded by
+    `top_n * prune_factor` entries per class regardless of file size.
+    """
+
+    def __init__(self, top_n=100, prune_factor=10):
+        self.top_n = top_n
+        self.max_tracked = top_n * prune_factor
+        self.rows = 0
+        self.sentiment_counts = Counter()
+        self.polarity_hist = np.zeros(len(POLARITY_BINS) - 1, dtype=np.int64)
+        self.word_counts = {s: Counter() for s in SENTIMENTS}
+        # Summed per chunk: a text repeated in several chunks is scored (or hit) once per chunk
+        self.unique = 0
+        self.hits = 0
+
+    def update(self, scores, tokens, stopwords, cache_stats=None):
+        self.rows += len(scores)
+        self.sentiment_counts.update(scores["Sentiment"].value_counts().to_dict())
+        self.polarity_hist += np.histogram(scores["Polarity"].clip(-1, 1), bins=POLARITY_BINS)[0]
+        for sentiment, group in tokens.groupby(scores["Sentiment"]):
+            counter = self.word_counts[sentiment]
+            for words in group:
+                counter.update(w for w in words if w not in stopwords)
+            if len(counter) > self.max_tracked:
+                self.word_counts[sentiment] = Counter(dict(counter.most_common(self.max_tracked)))
+        if cache_stats:
+            self.unique += cache_stats["unique"]
+            self.hits += cache_stats["hits"]
+
+    def top_words(self, sentiment):
+        return dict(self.word_counts[sentiment].most_common(self.top_n))
+
+
+# Score a CSV in chunks, spilling scored rows to disk and keeping only aggregates in memory.
+# A spill file created here is removed again if scoring fails; a ".gz" spill path is gzipped.
+def stream_sentiment(source, cache, scorer, chunksize=5000, stopwords=(), top_n=100,
+                     spill_path=None, on_chunk=None, compress=False):
+    owns_spill = spill_path is None
+    if owns_spill:
+        fd, spill_path = tempfile.mkstemp(prefix="sentiment_", suffix=".csv.gz" if compress else ".csv")
+        os.close(fd)
+    aggregates = StreamingAggregates(top_n=top_n)
+    stopwords = set(stopwords)
+    opener = gzip.open if spill_path.endswith(".gz") else open
+
+    try:
+        with opener(spill_path, "wt", newline="", encoding="utf-8") as spill:
+            for i, chunk in enumerate(pd.read_csv(source, chunksize=chunksize)):
+                if "text" not in chunk.columns:
+                    raise ValueError("The dataset must contain a 'text' column.")
+                chunk["cleaned_text"], tokens = tokenize_series(chunk["text"])
+                scores, cache_stats = cache.score_series(chunk["cleaned_text"], scorer)
+                chunk[["Sentiment", "Polarity", "Subjectivity"]] = scores
+                chunk.to_csv(spill, index=False, header=(i == 0))
+                aggregates.update(scores, tokens, stopwords, cache_stats)
+                if on_chunk:
+                    on_chunk(i, aggregates)
+    except BaseException:
+        if owns_spill and os.path.exists(spill_path):
+            os.remove(spill_path)
+        raise
+    return aggregates, spill_path
@@ -0,0 +1,56 @@
+import streamlit as st
+
+# Process-wide caches shared by every page of the launcher. Heavy libraries are
+# imported inside each loader so a page only pays for what it actually uses.
+
+
+@st.cache_resource
+def get_price_store():
+    from price_store import PriceStore
+
+    return PriceStore()
+
+
+# One engine per parameter set, so watchlist rescans only process new bars
+@st.cache_resource
+def get_indicator_engine(short_window=50, long_window=200, rsi_period=14):
+    from indicators import IndicatorEngine
+
+    return IndicatorEngine(short_window, long_window, rsi_period)
+
+
+@st.cache_resource
+def get_sentiment_cache():
+    from sentiment_cache import SentimentCache
+
+    return SentimentCache()
+
+
+@st.cache_resource
+def load_music_model(model_path="music_genre_classifier.pkl", encoder_path="label_encoder.pkl"):
+    import joblib
+
+    return joblib.load(model_path), joblib.load(encoder_path)
+
+
+@st.cache_data
+def load_movies(path="movies.csv"):
+    import pandas as pd
+
+    return pd.read_csv(path)
+
+
+@st.cache_data
+def load_builtin_dataset(name):
+    import pandas as pd
+    from sklearn import datasets
+
+    loaders = {
+        "iris": datasets.load_iris,
+        "wine": datasets.load_wine,
+        "california_housing": datasets.fetch_california_housing,
+    }
+    data = loaders[name]()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df['target'] = data.target
+    return df
@@ -1,150 +1,225 @@
-import yfinance as yf
 import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 from datetime import date
-
-# Streamlit App Configuration
-st.set_page_config(page_title="Stock Trend Analysis", layout="wide")
-
-# Sidebar for User Input
-st.sidebar.title("📊 Stock Analysis Tool")
-stock_symbol = st.sidebar.text_input("Enter Stock Symbol (e.g., AAPL, MSFT):", "AAPL").upper()
-start_date = st.sidebar.date_input("Start Date:", date(2020, 1, 1))
-end_date = st.sidebar.date_input("End Date:", date.today())
-
-st.title(f"📈 {stock_symbol} Stock Price Trend Analysis")
-
-# Function to Calculate RSI
-def calculate_rsi(data, period=14):
-    delta = data["Close"].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
-
-# Fetch Data Button
-if st.sidebar.button("🔍 Analyze Stock Data"):
-    if start_date >= end_date:
-        st.error("❌ Invalid date range. The start date must be before the end date.")
+from indicators import compute_indicators
+from chart_decimation import choose_resolution, resample_ohlcv, decimate_series, payload_size, format_bytes
+from shared import get_price_store, get_indicator_engine
+from profiling import page, span
+
+def main():
+    # Sidebar for User Input
+    st.sidebar.title("📊 Stock Analysis Tool")
+    mode = st.sidebar.radio("Mode:", ["Single Stock", "Watchlist"])
+    if mode == "Watchlist":
+        watchlist_text = st.sidebar.text_area("Symbols (comma or newline separated):", "AAPL, MSFT, GOOGL, AMZN, NVDA")
+    else:
+        stock_symbol = st.sidebar.text_input("Enter Stock Symbol (e.g., AAPL, MSFT):", "AAPL").upper()
+        run_backtest = st.sidebar.checkbox("🧪 Backtest MA crossover windows")
+        chart_width = st.sidebar.number_input("Chart width (px):", min_value=400, max_value=4000, value=1200, step=100)
+    start_date = st.sidebar.date_input("Start Date:", date(2020, 1, 1))
+    end_date = st.sidebar.date_input("End Date:", date.today())
+
+    if mode == "Watchlist":
+        st.title("📋 Watchlist Screener")
     else:
-        try:
-            # Fetch Stock Data
-            stock_data = yf.download(stock_symbol, start=start_date, end=end_date)
+        st.title(f"📈 {stock_symbol} Stock Price Trend Analysis")
+
+    # Watchlist Mode: fetch all symbols concurrently, then screen each on its own bars
+    if mode == "Watchlist":
+        from watchlist import fetch_watchlist, screener_table
 
-            if stock_data.empty:
-                st.error("⚠️ No data found. Please check the stock symbol or date range.")
+        if st.sidebar.button("🔍 Scan Watchlist"):
+            symbols = watchlist_text.replace("\n", ",").split(",")
+            if start_date >= end_date:
+                st.error("❌ Invalid date range. The start date must be before the end date.")
             else:
-                # Moving Averages
-                stock_data["50_day_MA"] = stock_data["Close"].rolling(window=50, min_periods=1).mean()
-                stock_data["200_day_MA"] = stock_data["Close"].rolling(window=200, min_periods=1).mean()
-
-                # RSI Calculation
-                stock_data["RSI"] = calculate_rsi(stock_data)
-
-                # Buy/Sell Signals (Example: Simple Moving Average Crossover)
-                stock_data["Buy_Signal"] = (stock_data["50_day_MA"] > stock_data["200_day_MA"]) & (
-                    stock_data["50_day_MA"].shift(1) <= stock_data["200_day_MA"].shift(1))
-                stock_data["Sell_Signal"] = (stock_data["50_day_MA"] < stock_data["200_day_MA"]) & (
-                    stock_data["50_day_MA"].shift(1) >= stock_data["200_day_MA"].shift(1))
-
-                # 📌 Candlestick Chart
-                fig = go.Figure()
-
-                fig.add_trace(go.Candlestick(
-                    x=stock_data.index,
-                    open=stock_data["Open"],
-                    high=stock_data["High"],
-                    low=stock_data["Low"],
-                    close=stock_data["Close"],
-                    name="Candlestick"
-                ))
-
-                # Moving Averages
-                fig.add_trace(go.Scatter(x=stock_data.index, y=stock_data["50_day_MA"],
-                                         mode="lines", name="50-Day MA", line=dict(color='red')))
-                fig.add_trace(go.Scatter(x=stock_data.index, y=stock_data["200_day_MA"],
-                                         mode="lines", name="200-Day MA", line=dict(color='green')))
-
-                # Buy/Sell Signal Markers
-                buy_points = stock_data[stock_data["Buy_Signal"]]
-                sell_points = stock_data[stock_data["Sell_Signal"]]
-
-                fig.add_trace(go.Scatter(
-                    x=buy_points.index, y=buy_points["Close"],
-                    mode="markers", name="🟢 Buy Signal",
-                    marker=dict(color="lime", size=10)
-                ))
-
-                fig.add_trace(go.Scatter(
-                    x=sell_points.index, y=sell_points["Close"],
-                    mode="markers", name="🔴 Sell Signal",
-                    marker=dict(color="red", size=10)
-                ))
-
-                fig.update_layout(title=f"{stock_symbol} Stock Price",
-                                  xaxis_title="Date", yaxis_title="Price (USD)",
-                                  xaxis_rangeslider_visible=False, template="plotly_dark")
-                st.plotly_chart(fig, use_container_width=True)
-
-                # 📉 Volume Chart
-                st.subheader("📊 Trading Volume")
-                volume_fig = go.Figure()
-                volume_fig.add_trace(go.Bar(
-                    x=stock_data.index, y=stock_data["Volume"], name="Volume",
-                    marker=dict(color="blue")
-                ))
-                volume_fig.update_layout(title="Trading Volume Over Time", xaxis_title="Date", yaxis_title="Volume")
-                st.plotly_chart(volume_fig, use_container_width=True)
-
-                # 📊 RSI Chart
-                st.subheader("📈 Relative Strength Index (RSI)")
-                rsi_fig = go.Figure()
-                rsi_fig.add_trace(go.Scatter(
-                    x=stock_data.index, y=stock_data["RSI"], mode="lines", name="RSI", line=dict(color='purple')
-                ))
-                rsi_fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought")
-                rsi_fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold")
-                rsi_fig.update_layout(title="Relative Strength Index (RSI)", xaxis_title="Date", yaxis_title="RSI Level")
-                st.plotly_chart(rsi_fig, use_container_width=True)
-
-                # 📌 Trend Analysis
-                if not stock_data.empty:
-                    latest_price = stock_data["Close"].dropna().iloc[-1] if not stock_data["Close"].dropna().empty else None
-                    latest_50_MA = stock_data["50_day_MA"].dropna().iloc[-1] if not stock_data["50_day_MA"].dropna().empty else None
-                    latest_200_MA = stock_data["200_day_MA"].dropna().iloc[-1] if not stock_data["200_day_MA"].dropna().empty else None
+                progress = st.progress(0.0, text="Fetching symbols...")
+                with span("fetch watchlist"):
+                    frames, errors = fetch_watchlist(
+                        get_price_store(), symbols, start_date, end_date,
+                        on_done=lambda done, total: progress.progress(done / total, text=f"Fetched {done}/{total} symbols"))
+                progress.empty()
+
+                if errors:
+                    st.warning("⚠️ Skipped: " + ", ".join(f"{s} ({e})" for s, e in sorted(errors.items())))
+                if not frames:
+                    st.error("⚠️ No data found for any symbol in the watchlist.")
                 else:
-                    latest_price = latest_50_MA = latest_200_MA = None
-
-                # Convert to float before formatting
-                if latest_price is not None:
-                    latest_price = float(latest_price)
-
-                if latest_50_MA is not None:
-                    latest_50_MA = float(latest_50_MA)
-
-                if latest_200_MA is not None:
-                    latest_200_MA = float(latest_200_MA)
-
-                # ✅ Use only the column version to avoid duplication
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Latest Price", f"${latest_price:.2f}")
-                col2.metric("50-Day Moving Avg", f"${latest_50_MA:.2f}")
-                col3.metric("200-Day Moving Avg", f"${latest_200_MA:.2f}")
-
-
-                if latest_price > latest_50_MA > latest_200_MA:
-                    st.success("📊 Strong Uptrend: The stock is consistently rising.")
-                elif latest_price < latest_50_MA < latest_200_MA:
-                    st.warning("📉 Downtrend: The stock is consistently falling.")
+                    with span("screener"):
+                        screener = screener_table(frames, engine=get_indicator_engine(50, 200, 14))
+                    st.subheader(f"📊 Screener ({len(screener)} symbols)")
+                    st.dataframe(screener, use_container_width=True)
+                    st.download_button(label="📥 Download Screener",
+                                       data=screener.to_csv().encode("utf-8"),
+                                       file_name="watchlist_screener.csv", mime="text/csv")
+        return
+
+    # Fetch Data Button
+    if st.sidebar.button("🔍 Analyze Stock Data"):
+        if start_date >= end_date:
+            st.error("❌ Invalid date range. The start date must be before the end date.")
+        else:
+            try:
+                # Fetch Stock Data (local price store: only missing ranges are downloaded)
+                with span("fetch prices"):
+                    stock_data = get_price_store().get(stock_symbol, start_date, end_date).copy()
+
+                if stock_data.empty:
+                    st.error("⚠️ No data found. Please check the stock symbol or date range.")
                 else:
-                    st.info("⚖️ Mixed Trend: Watch for breakout signals.")
-
-                # 📥 Data Download Option
-                csv = stock_data.to_csv().encode("utf-8")
-                st.download_button(label="📥 Download Stock Data",
-                                   data=csv, file_name=f"{stock_symbol}_data.csv",
-                                   mime="text/csv")
-
-        except Exception as e:
-            st.error(f"❌ An error occurred: {e}")
+                    # Moving Averages, Wilder RSI and Buy/Sell Signals (Simple Moving Average Crossover)
+                    with span("indicators"):
+                        indicators = compute_indicators(stock_data["Close"], short_window=50, long_window=200, rsi_period=14)
+                        stock_data["50_day_MA"] = indicators["short_ma"]
+                        stock_data["200_day_MA"] = indicators["long_ma"]
+                        stock_data["RSI"] = indicators["rsi"]
+                        stock_data["Buy_Signal"] = indicators["signal"] == 1
+                        stock_data["Sell_Signal"] = indicators["signal"] == -1
+
+                    # Chart resolution: coarser candles and LTTB-downsampled lines for long ranges
+                    with span("decimate"):
+                        resolution = choose_resolution(len(stock_data), chart_width)
+                        candles = resample_ohlcv(stock_data, resolution)
+                        ma_50 = decimate_series(stock_data["50_day_MA"], chart_width)
+                        ma_200 = decimate_series(stock_data["200_day_MA"], chart_width)
+
+                    with span("price chart"):
+                        # 📌 Candlestick Chart
+                        fig = go.Figure()
+
+                        fig.add_trace(go.Candlestick(
+                            x=candles.index,
+                            open=candles["Open"],
+                            high=candles["High"],
+                            low=candles["Low"],
+                            close=candles["Close"],
+                            name="Candlestick"
+                        ))
+
+                        # Moving Averages
+                        fig.add_trace(go.Scatter(x=ma_50.index, y=ma_50,
+                                                 mode="lines", name="50-Day MA", line=dict(color='red')))
+                        fig.add_trace(go.Scatter(x=ma_200.index, y=ma_200,
+                                                 mode="lines", name="200-Day MA", line=dict(color='green')))
+
+                        # Buy/Sell Signal Markers (always at full daily resolution)
+                        buy_points = stock_data[stock_data["Buy_Signal"]]
+                        sell_points = stock_data[stock_data["Sell_Signal"]]
+
+                        fig.add_trace(go.Scatter(
+                            x=buy_points.index, y=buy_points["Close"],
+                            mode="markers", name="🟢 Buy Signal",
+                            marker=dict(color="lime", size=10)
+                        ))
+
+                        fig.add_trace(go.Scatter(
+                            x=sell_points.index, y=sell_points["Close"],
+                            mode="markers", name="🔴 Sell Signal",
+                            marker=dict(color="red", size=10)
+                        ))
+
+                        fig.update_layout(title=f"{stock_symbol} Stock Price ({resolution} candles)",
+                                          xaxis_title="Date", yaxis_title="Price (USD)",
+                                          xaxis_rangeslider_visible=False, template="plotly_dark")
+                        st.plotly_chart(fig, use_container_width=True)
+                        st.caption(f"{len(stock_data)} daily bars shown as {len(candles)} {resolution.lower()} candles, "
+                                   f"payload {format_bytes(payload_size(fig))}")
+
+                    with span("volume chart"):
+                        # 📉 Volume Chart
+                        st.subheader("📊 Trading Volume")
+                        volume_fig = go.Figure()
+                        volume_fig.add_trace(go.Bar(
+                            x=candles.index, y=candles["Volume"], name="Volume",
+                            marker=dict(color="blue")
+                        ))
+                        volume_fig.update_layout(title="Trading Volume Over Time", xaxis_title="Date", yaxis_title="Volume")
+                        st.plotly_chart(volume_fig, use_container_width=True)
+                        st.caption(f"Payload {format_bytes(payload_size(volume_fig))}")
+
+                    with span("RSI chart"):
+                        # 📊 RSI Chart
+                        st.subheader("📈 Relative Strength Index (RSI)")
+                        rsi = decimate_series(stock_data["RSI"], chart_width)
+                        rsi_fig = go.Figure()
+                        rsi_fig.add_trace(go.Scatter(
+                            x=rsi.index, y=rsi, mode="lines", name="RSI", line=dict(color='purple')
+                        ))
+                        rsi_fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought")
+                        rsi_fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold")
+                        rsi_fig.update_layout(title="Relative Strength Index (RSI)", xaxis_title="Date", yaxis_title="RSI Level")
+                        st.plotly_chart(rsi_fig, use_container_width=True)
+                        st.caption(f"{len(rsi)} of {stock_data['RSI'].notna().sum()} points, "
+                                   f"payload {format_bytes(payload_size(rsi_fig))}")
+
+                    # 📌 Trend Analysis
+                    if not stock_data.empty:
+                        latest_price = stock_data["Close"].dropna().iloc[-1] if not stock_data["Close"].dropna().empty else None
+                        latest_50_MA = stock_data["50_day_MA"].dropna().iloc[-1] if not stock_data["50_day_MA"].dropna().empty else None
+                        latest_200_MA = stock_data["200_day_MA"].dropna().iloc[-1] if not stock_data["200_day_MA"].dropna().empty else None
+                    else:
+                        latest_price = latest_50_MA = latest_200_MA = None
+
+                    # Convert to float before formatting
+                    if latest_price is not None:
+                        latest_price = float(latest_price)
+
+                    if latest_50_MA is not None:
+                        latest_50_MA = float(latest_50_MA)
+
+                    if latest_200_MA is not None:
+                        latest_200_MA = float(latest_200_MA)
+
+                    # ✅ Use only the column version to avoid duplication
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Latest Price", f"${latest_price:.2f}")
+                    col2.metric("50-Day Moving Avg", f"${latest_50_MA:.2f}")
+                    col3.metric("200-Day Moving Avg", f"${latest_200_MA:.2f}")
+
+
+                    if latest_price > latest_50_MA > latest_200_MA:
+                        st.success("📊 Strong Uptrend: The stock is consistently rising.")
+                    elif latest_price < latest_50_MA < latest_200_MA:
+                        st.warning("📉 Downtrend: The stock is consistently falling.")
+                    else:
+                        st.info("⚖️ Mixed Trend: Watch for breakout signals.")
+
+                    # 🧪 Crossover Backtest over a grid of window lengths
+                    if run_backtest:
+                        from backtest import sweep_crossover, buy_and_hold
+
+                        st.subheader("🧪 MA Crossover Backtest")
+                        close = stock_data["Close"].dropna()
+                        with span("backtest sweep"):
+                            with st.spinner("Sweeping window grid..."):
+                                results = sweep_crossover(close, range(5, 101, 5), range(20, 301, 10))
+                        if results.empty:
+                            st.info("Not enough data to backtest.")
+                        else:
+                            benchmark = buy_and_hold(close)
+                            grid = results.pivot(index="short_window", columns="long_window", values="total_return")
+                            heatmap = go.Figure(go.Heatmap(z=grid.values * 100, x=grid.columns, y=grid.index,
+                                                           colorscale="RdYlGn", colorbar=dict(title="Return %")))
+                            heatmap.update_layout(title="Total Return by Window Pair", xaxis_title="Long Window",
+                                                  yaxis_title="Short Window")
+                            st.plotly_chart(heatmap, use_container_width=True)
+                            st.caption(f"Buy & hold: {benchmark['total_return']:.1%} return, "
+                                       f"{benchmark['max_drawdown']:.1%} max drawdown")
+                            st.dataframe(results.sort_values("total_return", ascending=False).head(20),
+                                         use_container_width=True)
+
+                    # 📥 Data Download Option
+                    csv = stock_data.to_csv().encode("utf-8")
+                    st.download_button(label="📥 Download Stock Data",
+                                       data=csv, file_name=f"{stock_symbol}_data.csv",
+                                       mime="text/csv")
+
+            except Exception as e:
+                st.error(f"❌ An error occurred: {e}")
+
+if __name__ == "__main__":
+    # Page config must come before any element, including the profiling toggle
+    st.set_page_config(page_title="Stock Trend Analysis", layout="wide")
+    with page("stock"):
+        main()
@@ -0,0 +1,41 @@
+import re
+from collections import Counter
+
+import pandas as pd
+
+# URLs, mentions, hashtags and punctuation removed in a single compiled pass.
+# Alternation order matters: URLs and tags must win over bare punctuation.
+CLEAN_PATTERN = re.compile(r"http\S+|@\w+|#\w+|[^\w\s]")
+
+
+# Clean a single string
+def normalize_text(text):
+    return CLEAN_PATTERN.sub("", str(text)).strip().lower()
+
+
+# Split a cleaned string into tokens
+def tokenize(text):
+    return normalize_text(text).split()
+
+
+# Clean a whole column at once using pandas string methods
+def normalize_series(texts):
+    texts = pd.Series(texts).fillna("").astype(str)
+    return texts.str.replace(CLEAN_PATTERN, "", regex=True).str.strip().str.lower()
+
+
+# Clean a whole column and return (cleaned text, token lists)
+def tokenize_series(texts):
+    cleaned = normalize_series(texts)
+    return cleaned, cleaned.str.split()
+
+
+# Count word frequencies from token lists, skipping stopwords
+def token_frequencies(token_lists, stopwords=None, max_words=None):
+    stopwords = stopwords or set()
+    counts = Counter()
+    for tokens in token_lists:
+        counts.update(t for t in tokens if t not in stopwords)
+    if max_words is not None:
+        return dict(counts.most_common(max_words))
+    return dict(counts)
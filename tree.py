@@ -3,34 +3,29 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor, plot_tree, export_text
-from sklearn.datasets import load_iris, fetch_california_housing, load_wine
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, mean_squared_error, classification_report, confusion_matrix
-from io import StringIO
-import graphviz
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+from tree_predictor import export_tree_arrays, save_tree_arrays, stream_predict_csv, compare_throughput
+from shared import load_builtin_dataset
+from profiling import page, span
 from sklearn.tree import export_graphviz
 
 def load_random_data():
     dataset_choice = st.sidebar.radio("Choose a Dataset", ["Iris (Classification)", "Wine (Classification)", "California Housing (Regression)", "Upload Your Own CSV"])
     
     if dataset_choice == "Iris (Classification)":
-        data = load_iris()
-        df = pd.DataFrame(data.data, columns=data.feature_names)
-        df['target'] = data.target
-        return df, 'target', 'classification'
+        return load_builtin_dataset("iris"), 'target', 'classification'
     
     elif dataset_choice == "Wine (Classification)":
-        data = load_wine()
-        df = pd.DataFrame(data.data, columns=data.feature_names)
-        df['target'] = data.target
-        return df, 'target', 'classification'
+        return load_builtin_dataset("wine"), 'target', 'classification'
     
     elif dataset_choice == "California Housing (Regression)":
-        data = fetch_california_housing()
-        df = pd.DataFrame(data.data, columns=data.feature_names)
-        df['target'] = data.target
-        return df, 'target', 'regression'
+        return load_builtin_dataset("california_housing"), 'target', 'regression'
     
     elif dataset_choice == "Upload Your Own CSV":
         uploaded_file = st.file_uploader("Upload CSV", type="csv")
@@ -42,68 +37,212 @@ def load_random_data():
         else:
             return None, None, None
 
-st.title("Decision Tree Model Explorer")
-st.write("Train & visualize a decision tree model on different datasets.")
+# Hash of the dataset contents, used to key the model and sweep caches
+def dataset_hash(df, target_column, task_type):
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update(repr((list(df.columns), target_column, task_type)).encode())
+    return digest.hexdigest()
 
-df, target_column, task_type = load_random_data()
-if df is not None:
-    st.write("### Dataset Preview")
-    st.write(df.head())
+def make_model(task_type, **params):
+    if task_type == 'classification':
+        return DecisionTreeClassifier(random_state=42, **params)
+    return DecisionTreeRegressor(random_state=42, **params)
 
-    X = df.drop(columns=[target_column])
-    y = df[target_column]
-    
+# Train/test split, fitted model, predictions and graphviz source, cached per dataset hash and parameters
+@st.cache_resource(max_entries=256)
+def fit_model(data_key, _df, target_column, task_type, max_depth, min_samples_split, min_samples_leaf, criterion):
+    X = _df.drop(columns=[target_column])
+    y = _df[target_column]
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
-    
-    st.sidebar.write("### Model Parameters")
-    max_depth = st.sidebar.slider("Max Depth", 1, 20, 5)
-    min_samples_split = st.sidebar.slider("Min Samples Split", 2, 10, 2)
-    min_samples_leaf = st.sidebar.slider("Min Samples Leaf", 1, 10, 1)
-    criterion = st.sidebar.radio("Criterion", ['gini', 'entropy'] if task_type == 'classification' else ['squared_error', 'friedman_mse'])
-    
-    if task_type == 'classification':
-        model = DecisionTreeClassifier(max_depth=max_depth, min_samples_split=min_samples_split, min_samples_leaf=min_samples_leaf, criterion=criterion, random_state=42)
-    else:
-        model = DecisionTreeRegressor(max_depth=max_depth, min_samples_split=min_samples_split, min_samples_leaf=min_samples_leaf, criterion=criterion, random_state=42)
-    
+    model = make_model(task_type, max_depth=max_depth, min_samples_split=min_samples_split,
+                       min_samples_leaf=min_samples_leaf, criterion=criterion)
     model.fit(X_train, y_train)
     y_pred = model.predict(X_test)
-    
-    st.write("### Model Performance")
-    if task_type == 'classification':
-        accuracy = accuracy_score(y_test, y_pred)
-        st.write(f"Accuracy: {accuracy:.2f}")
-        
-        st.write("#### Confusion Matrix")
-        fig, ax = plt.subplots()
-        sns.heatmap(confusion_matrix(y_test, y_pred), annot=True, fmt='d', cmap='Blues', ax=ax)
-        st.pyplot(fig)
-        
-        st.write("#### Classification Report")
-        st.text(classification_report(y_test, y_pred))
-    else:
-        mse = mean_squared_error(y_test, y_pred)
-        st.write(f"Mean Squared Error: {mse:.2f}")
-        
-        st.write("#### Residual Plot")
+    dot_data = export_graphviz(model, feature_names=X.columns, filled=True, rounded=True, special_characters=True)
+    return model, X_test, y_test, y_pred, dot_data
+
+# Cross-validated sweep over the full parameter grid, fitted in parallel
+SWEEP_GRID = {
+    "max_depth": list(range(1, 21)),
+    "min_samples_split": [2, 4, 6, 8, 10],
+    "min_samples_leaf": [1, 2, 4, 6, 8, 10],
+}
+
+@st.cache_data
+def run_sweep(data_key, _df, target_column, task_type, cv=5):
+    from sklearn.model_selection import GridSearchCV
+    X = _df.drop(columns=[target_column])
+    y = _df[target_column]
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.3, random_state=42)
+    criteria = ['gini', 'entropy'] if task_type == 'classification' else ['squared_error', 'friedman_mse']
+    search = GridSearchCV(make_model(task_type), {**SWEEP_GRID, "criterion": criteria},
+                          scoring='accuracy' if task_type == 'classification' else 'neg_mean_squared_error',
+                          cv=cv, n_jobs=-1, refit=False)
+    search.fit(X_train, y_train)
+    results = pd.DataFrame(search.cv_results_["params"])
+    results["score"] = search.cv_results_["mean_test_score"]
+    results["score_std"] = search.cv_results_["std_test_score"]
+    return results
+
+# Clicking a heatmap cell loads its best parameters into the sliders before they are drawn
+def load_selected_params(task_type):
+    points = st.session_state["sweep_chart"].selection.points
+    if points:
+        max_depth, min_samples_split, min_samples_leaf, criterion = points[0]["customdata"]
+        st.session_state["max_depth"] = int(max_depth)
+        st.session_state["min_samples_split"] = int(min_samples_split)
+        st.session_state["min_samples_leaf"] = int(min_samples_leaf)
+        st.session_state[f"criterion_{task_type}"] = criterion
+
+# Delete the output of a previous batch scoring run, if any
+def discard_scored_file():
+    previous = st.session_state.pop("batch_scored", None)
+    if previous and os.path.exists(previous["path"]):
+        os.remove(previous["path"])
+
+def main():
+    st.title("Decision Tree Model Explorer")
+    st.write("Train & visualize a decision tree model on different datasets.")
+
+    with span("load data"):
+        df, target_column, task_type = load_random_data()
+    if df is not None:
+        st.write("### Dataset Preview")
+        st.write(df.head())
+
+        X = df.drop(columns=[target_column])
+        data_key = dataset_hash(df, target_column, task_type)
+
+        st.sidebar.write("### Model Parameters")
+        # Defaults live in session state so a sweep selection can overwrite them
+        st.session_state.setdefault("max_depth", 5)
+        st.session_state.setdefault("min_samples_split", 2)
+        st.session_state.setdefault("min_samples_leaf", 1)
+        max_depth = st.sidebar.slider("Max Depth", 1, 20, key="max_depth")
+        min_samples_split = st.sidebar.slider("Min Samples Split", 2, 10, key="min_samples_split")
+        min_samples_leaf = st.sidebar.slider("Min Samples Leaf", 1, 10, key="min_samples_leaf")
+        criterion = st.sidebar.radio("Criterion", ['gini', 'entropy'] if task_type == 'classification' else ['squared_error', 'friedman_mse'], key=f"criterion_{task_type}")
+
+        with span("fit model"):
+            model, X_test, y_test, y_pred, dot_data = fit_model(data_key, df, target_column, task_type, max_depth,
+                                                                min_samples_split, min_samples_leaf, criterion)
+
+        if st.sidebar.checkbox("Hyperparameter Sweep"):
+            import plotly.graph_objects as go
+
+            st.write("### Hyperparameter Sweep")
+            with span("sweep"), st.spinner("Cross-validating the parameter grid..."):
+                results = run_sweep(data_key, df, target_column, task_type)
+            # One cell per (max_depth, min_samples_leaf), showing the best split size and criterion for it
+            best = results.loc[results.groupby(["max_depth", "min_samples_leaf"])["score"].idxmax()]
+            score_label = "CV Accuracy" if task_type == 'classification' else "CV MSE"
+            scores = best["score"] if task_type == 'classification' else -best["score"]
+            sweep_fig = go.Figure(go.Scatter(
+                x=best["max_depth"], y=best["min_samples_leaf"], mode="markers",
+                marker=dict(symbol="square", size=22, color=scores, colorscale="Viridis",
+                            reversescale=task_type != 'classification', colorbar=dict(title=score_label)),
+                customdata=best[["max_depth", "min_samples_split", "min_samples_leaf", "criterion"]].values,
+                text=[f"{score_label}: {v:.4f}" for v in scores],
+                hovertemplate="Max Depth %{customdata[0]}<br>Min Samples Leaf %{customdata[2]}<br>"
+                              "Min Samples Split %{customdata[1]}<br>Criterion %{customdata[3]}<br>%{text}<extra></extra>",
+            ))
+            sweep_fig.update_layout(title="Validation Curve (click a cell to load that model)",
+                                    xaxis_title="Max Depth", yaxis_title="Min Samples Leaf")
+            st.plotly_chart(sweep_fig, use_container_width=True, key="sweep_chart",
+                            on_select=lambda: load_selected_params(task_type), selection_mode="points")
+
+        st.write("### Model Performance")
+        if task_type == 'classification':
+            accuracy = accuracy_score(y_test, y_pred)
+            st.write(f"Accuracy: {accuracy:.2f}")
+
+            st.write("#### Confusion Matrix")
+            fig, ax = plt.subplots()
+            sns.heatmap(confusion_matrix(y_test, y_pred), annot=True, fmt='d', cmap='Blues', ax=ax)
+            st.pyplot(fig)
+
+            st.write("#### Classification Report")
+            st.text(classification_report(y_test, y_pred))
+        else:
+            mse = mean_squared_error(y_test, y_pred)
+            st.write(f"Mean Squared Error: {mse:.2f}")
+
+            st.write("#### Residual Plot")
+            fig, ax = plt.subplots()
+            sns.histplot(y_test - y_pred, kde=True, ax=ax)
+            st.pyplot(fig)
+
+        st.write("### Feature Importance")
+        feature_importance = pd.DataFrame({'Feature': X.columns, 'Importance': model.feature_importances_})
+        feature_importance = feature_importance.sort_values(by='Importance', ascending=False)
+
         fig, ax = plt.subplots()
-        sns.histplot(y_test - y_pred, kde=True, ax=ax)
+        sns.barplot(x='Importance', y='Feature', data=feature_importance, ax=ax)
         st.pyplot(fig)
-    
-    st.write("### Feature Importance")
-    feature_importance = pd.DataFrame({'Feature': X.columns, 'Importance': model.feature_importances_})
-    feature_importance = feature_importance.sort_values(by='Importance', ascending=False)
-    
-    fig, ax = plt.subplots()
-    sns.barplot(x='Importance', y='Feature', data=feature_importance, ax=ax)
-    st.pyplot(fig)
-    
-    st.write("### Decision Tree Visualization")
-    dot_data = export_graphviz(model, feature_names=X.columns, filled=True, rounded=True, special_characters=True)
-    st.graphviz_chart(dot_data)
-    
-    st.write("### Download Predictions")
-    output_df = X_test.copy()
-    output_df['Actual'] = y_test
-    output_df['Predicted'] = y_pred
-    st.download_button("Download Predictions", output_df.to_csv(index=False), "predictions.csv", "text/csv")
+
+        st.write("### Decision Tree Visualization")
+        with span("render tree"):
+            st.graphviz_chart(dot_data)
+
+        st.write("### Batch Scoring")
+        with span("compile tree"):
+            tree_arrays = export_tree_arrays(model, feature_names=X.columns)
+            arrays_file = BytesIO()
+            save_tree_arrays(tree_arrays, arrays_file)
+        st.download_button("Download Compiled Tree (.npz)", arrays_file.getvalue(), "tree_arrays.npz", "application/octet-stream")
+
+        if st.checkbox("Compare throughput against model.predict"):
+            bench_X = pd.concat([X_test] * max(1, 200_000 // max(len(X_test), 1)), ignore_index=True)
+            with span("throughput"):
+                throughput = compare_throughput(model, tree_arrays, bench_X)
+            col1, col2, col3 = st.columns(3)
+            col1.metric("sklearn rows/s", f"{throughput['sklearn_rows_per_s']:,.0f}")
+            col2.metric("Array predictor rows/s", f"{throughput['array_rows_per_s']:,.0f}")
+            col3.metric("Speedup", f"{throughput['speedup']:.2f}x")
+            st.caption(f"{throughput['rows']:,} rows; predictions match: {throughput['predictions_match']}")
+
+        score_file = st.file_uploader("Score a large CSV with the compiled tree", type="csv", key="score_file")
+        # Scored output is kept per (file, model), so reruns from other widgets reuse it
+        score_key = (score_file.file_id, data_key, max_depth, min_samples_split, min_samples_leaf,
+                     criterion) if score_file is not None else None
+        scored = st.session_state.get("batch_scored")
+        if scored is not None and scored["key"] != score_key:
+            discard_scored_file()
+            scored = None
+        if score_file is not None:
+            missing = [c for c in X.columns if c not in pd.read_csv(score_file, nrows=0).columns]
+            score_file.seek(0)
+            if missing:
+                st.error(f"The file is missing feature columns: {', '.join(missing)}")
+            elif scored is None and st.button("Score File"):
+                fd, scored_path = tempfile.mkstemp(prefix="scored_", suffix=".csv.gz")
+                os.close(fd)
+                progress = st.progress(0.0, text="Scoring...")
+                try:
+                    with span("batch scoring"):
+                        rows = stream_predict_csv(tree_arrays, score_file, scored_path,
+                                                  on_chunk=lambda i, n: progress.progress(
+                                                      min(score_file.tell() / max(score_file.size, 1), 1.0),
+                                                      text=f"{n:,} rows scored"))
+                    progress.progress(1.0, text=f"Done: {rows:,} rows scored")
+                    scored = st.session_state["batch_scored"] = {"key": score_key, "path": scored_path, "rows": rows}
+                except ValueError as e:
+                    progress.empty()
+                    st.error(str(e))
+                finally:
+                    if scored is None:
+                        os.remove(scored_path)
+            if scored is not None:
+                with open(scored["path"], "rb") as f:
+                    st.download_button(f"Download Scored CSV ({scored['rows']:,} rows, gzip)", f, "scored.csv.gz",
+                                       "application/gzip", on_click="ignore")
+
+        st.write("### Download Predictions")
+        output_df = X_test.copy()
+        output_df['Actual'] = y_test
+        output_df['Predicted'] = y_pred
+        st.download_button("Download Predictions", output_df.to_csv(index=False), "predictions.csv", "text/csv")
+
+if __name__ == "__main__":
+    with page("tree"):
+        main()
@@ -0,0 +1,109 @@
+import gzip
+import time
+
+import numpy as np
+import pandas as pd
+
+LEAF = -1
+
+
+# Flatten a fitted sklearn tree into plain arrays (needs sklearn only at export time).
+# Every array has a numeric or fixed-width string dtype, so saved files load without pickle.
+def export_tree_arrays(model, feature_names=None):
+    tree = model.tree_
+    values = tree.value[:, 0, :]
+    if hasattr(model, "classes_"):
+        # Classifiers store per-class counts or fractions; keep the winning class per node
+        outputs = np.asarray(model.classes_)[values.argmax(axis=1)]
+        if outputs.dtype == object:
+            outputs = outputs.astype(np.str_)
+    else:
+        outputs = values[:, 0]
+    # Trees fitted on data with NaNs (sklearn >= 1.3) record which way missing values go at each split
+    missing_left = getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=np.uint8))
+    return {
+        "feature": tree.feature.astype(np.int32),
+        "threshold": tree.threshold.astype(np.float64),
+        "left": tree.children_left.astype(np.int32),
+        "right": tree.children_right.astype(np.int32),
+        "missing_left": np.asarray(missing_left, dtype=bool),
+        "value": outputs,
+        "feature_names": np.asarray([str(name) for name in (feature_names if feature_names is not None else [])],
+                                    dtype=np.str_),
+    }
+
+
+def save_tree_arrays(arrays, path):
+    np.savez_compressed(path, **arrays)
+
+
+def load_tree_arrays(path):
+    with np.load(path, allow_pickle=False) as data:
+        return {key: data[key] for key in data.files}
+
+
+def predict_arrays(arrays, X):
+    """Score rows with a flattened tree using only NumPy.
+
+    All rows descend one level per iteration, so the Python loop runs at most
+    `max_depth` times regardless of the number of rows.
+    """
+    # sklearn compares float32 inputs against float64 thresholds; do the same to match it exactly
+    X = np.asarray(X, dtype=np.float32)
+    feature, threshold = arrays["feature"], arrays["threshold"]
+    left, right = arrays["left"], arrays["right"]
+    missing_left = arrays.get("missing_left", np.zeros(len(left), dtype=bool))
+    node = np.zeros(len(X), dtype=np.int32)
+    active = np.arange(len(X)) if left[0] != LEAF else np.arange(0)
+    while active.size:
+        current = node[active]
+        x = X[active, feature[current]]
+        go_left = np.where(np.isnan(x), missing_left[current], x <= threshold[current])
+        node[active] = np.where(go_left, left[current], right[current])
+        active = active[left[node[active]] != LEAF]
+    return arrays["value"][node]
+
+
+# Score a CSV chunk by chunk, appending predictions to `output_path` as each chunk completes;
+# a ".gz" output path is gzipped
+def stream_predict_csv(arrays, input_path, output_path, chunksize=100_000, on_chunk=None):
+    feature_names = list(arrays["feature_names"])
+    rows = 0
+    opener = gzip.open if str(output_path).endswith(".gz") else open
+    with opener(output_path, "wt", newline="", encoding="utf-8") as out:
+        for i, chunk in enumerate(pd.read_csv(input_path, chunksize=chunksize)):
+            X = chunk[feature_names] if feature_names else chunk
+            non_numeric = [c for c in X.columns if not pd.api.types.is_numeric_dtype(X[c])]
+            if non_numeric:
+                raise ValueError(f"Non-numeric values in feature columns: {', '.join(map(str, non_numeric))}")
+            chunk["Predicted"] = predict_arrays(arrays, X.to_numpy())
+            chunk.to_csv(out, index=False, header=(i == 0))
+            rows += len(chunk)
+            if on_chunk:
+                on_chunk(i, rows)
+    return rows
+
+
+# Rows per second for the flat-array predictor against model.predict on the same data
+def compare_throughput(model, arrays, X, repeats=3):
+    X_values = np.asarray(X, dtype=np.float32)
+    X_frame = X if isinstance(X, pd.DataFrame) else pd.DataFrame(X_values)
+
+    def best_time(fn):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    sklearn_time = best_time(lambda: model.predict(X_frame))
+    array_time = best_time(lambda: predict_arrays(arrays, X_values))
+    agree = np.array_equal(np.asarray(model.predict(X_frame)), predict_arrays(arrays, X_values))
+    return {
+        "rows": len(X_values),
+        "sklearn_rows_per_s": len(X_values) / sklearn_time if sklearn_time else np.inf,
+        "array_rows_per_s": len(X_values) / array_time if array_time else np.inf,
+        "speedup": sklearn_time / array_time if array_time else np.inf,
+        "predictions_match": bool(agree),
+    }
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from indicators import IndicatorState
+
+# Fetches are I/O bound, so the pool grows with the watchlist up to this many threads
+MAX_FETCH_WORKERS = 64
+
+
+# Fetch every symbol concurrently; wall time tracks the slowest fetch, not the sum,
+# as long as the watchlist fits in the pool
+def fetch_watchlist(store, symbols, start, end, max_workers=MAX_FETCH_WORKERS, on_done=None):
+    frames, errors = {}, {}
+    symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+    if not symbols:
+        return frames, errors
+    with ThreadPoolExecutor(max_workers=min(len(symbols), max_workers)) as pool:
+        futures = {pool.submit(store.get, symbol, start, end): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                df = future.result()
+                if df.empty:
+                    errors[symbol] = "No data found"
+                else:
+                    frames[symbol] = df
+            except Exception as e:
+                errors[symbol] = str(e)
+            if on_done:
+                on_done(len(frames) + len(errors), len(symbols))
+    return frames, errors
+
+
+# One row per symbol with the latest indicator values and most recent crossover.
+# Each symbol is computed on its own bars: aligned on a shared dates x symbols
+# calendar, rolling windows would count other symbols' trading days and RSI
+# would skip the moves across missing rows. With an IndicatorEngine, a rescan
+# only processes the bars appended since the previous scan.
+def screener_table(frames, short_window=50, long_window=200, rsi_period=14, engine=None, field="Close"):
+    if engine is not None:
+        short_window, long_window, rsi_period = engine.params
+    rows = {}
+    for symbol, df in frames.items():
+        series = df[field].dropna().sort_index()
+        if series.empty:
+            continue
+        if engine is not None:
+            state = engine.state(symbol, series)
+        else:
+            state = IndicatorState.from_history(series, short_window, long_window, rsi_period)
+        rows[symbol] = _screener_row(series, state, short_window, long_window)
+    table = pd.DataFrame.from_dict(rows, orient="index")
+    table.index.name = "Symbol"
+    return table.sort_index()
+
+
+def _screener_row(series, state, short_window, long_window):
+    latest = state.latest
+    price, short_ma, long_ma = latest["close"], latest["short_ma"], latest["long_ma"]
+    if price > short_ma > long_ma:
+        trend = "Uptrend"
+    elif price < short_ma < long_ma:
+        trend = "Downtrend"
+    else:
+        trend = "Mixed"
+    return {
+        "Last Close": price,
+        "Change %": (price / series.iloc[0] - 1) * 100,
+        f"{short_window}-Day MA": short_ma,
+        f"{long_window}-Day MA": long_ma,
+        "RSI": latest["rsi"],
+        "Trend": trend,
+        "Last Signal": {1: "Buy", -1: "Sell"}.get(state.last_signal, np.nan),
+        "Signal Date": pd.to_datetime(state.last_signal_time),
+    }